@@ -341,16 +341,29 @@ impl PyUnknownDataclass {
     }
 
     /// String representation: ClassName(field1=value1, field2=value2, ...)
+    ///
+    /// Written in a single pass into one buffer: each field's repr is copied straight
+    /// from the Python string rather than via an owned `String` and a joined `Vec`.
     fn __repr__(&self, py: Python<'_>) -> PyResult<String> {
         let attrs = self.attrs.bind(py);
-        let mut parts = Vec::new();
+        let mut out = String::with_capacity(self.name.len() + 22 + self.field_names.len() * 16);
+        out.push_str("<Unknown Dataclass ");
+        out.push_str(&self.name);
+        out.push('(');
+        let mut first = true;
         for field_name in &self.field_names {
             if let Some(value) = attrs.get_item(field_name)? {
-                let value_repr: String = value.repr()?.extract()?;
-                parts.push(format!("{field_name}={value_repr}"));
+                if !first {
+                    out.push_str(", ");
+                }
+                first = false;
+                out.push_str(field_name);
+                out.push('=');
+                out.push_str(value.repr()?.to_str()?);
             }
         }
-        Ok(format!("<Unknown Dataclass {}({})>", self.name, parts.join(", ")))
+        out.push_str(")>");
+        Ok(out)
     }
 
     /// Equality comparison.
@@ -4,12 +4,16 @@
 //! including time limits, memory limits, and recursion depth.
 
 use std::{
-    sync::atomic::{AtomicU16, Ordering},
-    time::Duration,
+    sync::atomic::{AtomicU16, AtomicU64, Ordering},
+    time::{Duration, Instant},
 };
 
 use monty::{DEFAULT_MAX_RECURSION_DEPTH, ResourceError, ResourceTracker};
-use pyo3::{prelude::*, types::PyDict};
+use pyo3::{
+    intern,
+    prelude::*,
+    types::{PyDict, PyString},
+};
 
 use crate::exceptions::exc_py_to_monty;
 
@@ -26,13 +30,19 @@ use crate::exceptions::exc_py_to_monty;
 /// (except `max_recursion_depth` which defaults to 1000).
 ///
 /// Raises `TypeError` if a value is present but has the wrong type.
+///
+/// The dict is only read here, once per `run()`/`start()` call: the result is a plain
+/// typed `monty::ResourceLimits` struct, so the interpreter loop never touches the dict.
+/// Keys are looked up via `intern!` so repeated calls reuse the same Python string
+/// objects (and their cached hashes) instead of creating a new `PyString` per lookup.
 pub fn extract_limits(dict: &Bound<'_, PyDict>) -> PyResult<monty::ResourceLimits> {
-    let max_allocations = extract_optional_usize(dict, "max_allocations")?;
-    let max_duration_secs = extract_optional_f64(dict, "max_duration_secs")?;
-    let max_memory = extract_optional_usize(dict, "max_memory")?;
-    let gc_interval = extract_optional_usize(dict, "gc_interval")?;
+    let py = dict.py();
+    let max_allocations = extract_optional_usize(dict, intern!(py, "max_allocations"))?;
+    let max_duration_secs = extract_optional_f64(dict, intern!(py, "max_duration_secs"))?;
+    let max_memory = extract_optional_usize(dict, intern!(py, "max_memory"))?;
+    let gc_interval = extract_optional_usize(dict, intern!(py, "gc_interval"))?;
     let max_recursion_depth =
-        extract_optional_usize(dict, "max_recursion_depth")?.or(Some(DEFAULT_MAX_RECURSION_DEPTH));
+        extract_optional_usize(dict, intern!(py, "max_recursion_depth"))?.or(Some(DEFAULT_MAX_RECURSION_DEPTH));
 
     let mut limits = monty::ResourceLimits::new().max_recursion_depth(max_recursion_depth);
 
@@ -53,7 +63,7 @@ pub fn extract_limits(dict: &Bound<'_, PyDict>) -> PyResult<monty::ResourceLimit
 }
 
 /// Extracts an optional usize from a dict, raising `TypeError` if the value has the wrong type.
-fn extract_optional_usize(dict: &Bound<'_, PyDict>, key: &str) -> PyResult<Option<usize>> {
+fn extract_optional_usize(dict: &Bound<'_, PyDict>, key: &Bound<'_, PyString>) -> PyResult<Option<usize>> {
     match dict.get_item(key)? {
         None => Ok(None),
         Some(value) if value.is_none() => Ok(None),
@@ -62,7 +72,7 @@ fn extract_optional_usize(dict: &Bound<'_, PyDict>, key: &str) -> PyResult<Optio
 }
 
 /// Extracts an optional f64 from a dict, raising `TypeError` if the value has the wrong type.
-fn extract_optional_f64(dict: &Bound<'_, PyDict>, key: &str) -> PyResult<Option<f64>> {
+fn extract_optional_f64(dict: &Bound<'_, PyDict>, key: &Bound<'_, PyString>) -> PyResult<Option<f64>> {
     match dict.get_item(key)? {
         None => Ok(None),
         Some(value) if value.is_none() => Ok(None),
@@ -70,26 +80,46 @@ fn extract_optional_f64(dict: &Bound<'_, PyDict>, key: &str) -> PyResult<Option<
     }
 }
 
-/// How often to check Python signals (every N calls to `check_time`).
+/// How often to consider checking Python signals (every N calls to `check_time`).
 ///
-/// This balances responsiveness to Ctrl+C against performance overhead.
-/// With ~1000 checks, signal handling adds negligible overhead while still
-/// responding to interrupts within a reasonable timeframe.
+/// Reading the clock is cheap but not free, so it is only done every N instructions.
 const SIGNAL_CHECK_INTERVAL: u16 = 1000;
 
+/// Minimum wall-clock time between Python signal checks, in nanoseconds.
+///
+/// Checking signals means re-attaching to the interpreter (the VM runs with the GIL
+/// released), which is far more expensive than an instruction and contends with other
+/// Python threads. Every `SIGNAL_CHECK_INTERVAL` instructions can be thousands of times a
+/// second, so checks are additionally spaced at least this far apart. 10ms keeps Ctrl+C
+/// responsive while bounding the attach rate to ~100/s.
+const SIGNAL_CHECK_PERIOD_NANOS: u64 = 10_000_000;
+
 /// A resource tracker that wraps another ResourceTracker and periodically checks Python signals.
 ///
 /// This allows Ctrl+C and other Python signals to interrupt long-running code
-/// executed through the monty interpreter. Signals are checked every
-/// `SIGNAL_CHECK_INTERVAL` calls to `check_time` (at statement boundaries).
+/// executed through the monty interpreter. Python's own C-level handlers only set a flag
+/// when a signal arrives; pending handlers are run here, from the VM's per-instruction
+/// `check_time` safe point, never mid-operation. Checks happen at most once every
+/// `SIGNAL_CHECK_PERIOD_NANOS`, and only the clock is consulted on the hot path.
 #[derive(Debug, serde::Serialize, serde::Deserialize)]
 pub struct PySignalTracker<T: ResourceTracker> {
     inner: T,
-    /// Counter for check_time calls, used to rate-limit signal checks.
+    /// Reference point for `last_check_nanos`. Reset to `Instant::now()` on deserialization.
+    #[serde(skip, default = "Instant::now")]
+    epoch: Instant,
+    /// Nanoseconds after `epoch` at which Python signals were last checked.
+    #[serde(skip)]
+    last_check_nanos: AtomicU64,
+    /// Number of `check_time` calls left before the clock is next consulted.
+    ///
+    /// Counts down rather than up so the per-instruction path is a load, compare and
+    /// store, with no modulo. This is all a run without limits pays per instruction.
     ///
     /// Uses `AtomicU16` for interior mutability so `check_time` can take `&self`
     /// (required by the `ResourceTracker` trait) while remaining `Sync` for PyO3.
-    check_counter: AtomicU16,
+    /// Like `LimitedTracker`'s counter it is updated with a relaxed load + store rather
+    /// than `fetch_sub`, since only the thread running the VM touches it.
+    check_countdown: AtomicU16,
 }
 
 impl<T: ResourceTracker> PySignalTracker<T> {
@@ -97,15 +127,26 @@ impl<T: ResourceTracker> PySignalTracker<T> {
     pub fn new(inner: T) -> Self {
         Self {
             inner,
-            check_counter: AtomicU16::new(0),
+            epoch: Instant::now(),
+            last_check_nanos: AtomicU64::new(0),
+            check_countdown: AtomicU16::new(SIGNAL_CHECK_INTERVAL),
         }
     }
 
+    /// Runs any pending Python signal handlers, rate-limited by instruction count and wall time.
+    ///
+    /// Returns the exception raised by a handler (e.g. `KeyboardInterrupt`) as a `ResourceError`.
     fn check_python_signals(&self) -> Result<(), ResourceError> {
-        // Periodically check Python signals
-        let count = self.check_counter.fetch_add(1, Ordering::Relaxed).wrapping_add(1);
+        let remaining = self.check_countdown.load(Ordering::Relaxed);
+        if remaining > 1 {
+            self.check_countdown.store(remaining - 1, Ordering::Relaxed);
+            return Ok(());
+        }
+        self.check_countdown.store(SIGNAL_CHECK_INTERVAL, Ordering::Relaxed);
 
-        if count.is_multiple_of(SIGNAL_CHECK_INTERVAL) {
+        let now = u64::try_from(self.epoch.elapsed().as_nanos()).unwrap_or(u64::MAX);
+        if now.saturating_sub(self.last_check_nanos.load(Ordering::Relaxed)) >= SIGNAL_CHECK_PERIOD_NANOS {
+            self.last_check_nanos.store(now, Ordering::Relaxed);
             Python::attach(|py| {
                 py.check_signals()
                     .map_err(|e| ResourceError::Exception(exc_py_to_monty(py, &e)))
@@ -124,6 +165,10 @@ impl<T: ResourceTracker> ResourceTracker for PySignalTracker<T> {
         self.inner.on_free(get_size);
     }
 
+    fn on_reconcile(&mut self, get_live_bytes: impl FnOnce() -> usize) {
+        self.inner.on_reconcile(get_live_bytes);
+    }
+
     fn check_time(&self) -> Result<(), ResourceError> {
         // First check inner tracker's time limit
         self.inner.check_time()?;
@@ -150,6 +150,12 @@ pub(crate) struct GatherFuture {
     /// TaskIds of spawned tasks (only for coroutine items, set when awaited).
     /// Length matches the number of Coroutine items.
     pub task_ids: Vec<TaskId>,
+    /// Number of spawned tasks that have not yet completed.
+    ///
+    /// Set to `task_ids.len()` when the gather is awaited and decremented as each task
+    /// finishes, so completion checks are O(1) instead of re-scanning (and cloning)
+    /// `task_ids` on every task completion or external future resolution.
+    pub pending_tasks: usize,
     /// Results from each item, in order (filled as items complete).
     /// Indices align with `items`.
     pub results: Vec<Option<Value>>,
@@ -170,6 +176,7 @@ impl GatherFuture {
         Self {
             items,
             task_ids: Vec::new(),
+            pending_tasks: 0,
             results: (0..count).map(|_| None).collect(),
             waiter: None,
             pending_calls: Vec::new(),
@@ -181,4 +188,22 @@ impl GatherFuture {
     pub fn item_count(&self) -> usize {
         self.items.len()
     }
+
+    /// Takes the collected results out of a completed gather, in item order.
+    ///
+    /// `Option<Value>` has the same layout as `Value` (asserted below), so the
+    /// `collect` reuses the `results` buffer in place: the result list receives the
+    /// allocation made in `new`, and a gather costs one results allocation in total.
+    ///
+    /// # Panics
+    /// Panics if any result is still missing, i.e. the gather is not complete.
+    pub fn take_results(&mut self) -> Vec<Value> {
+        std::mem::take(&mut self.results)
+            .into_iter()
+            .map(|r| r.expect("all results should be filled when gather is complete"))
+            .collect()
+    }
 }
+
+// `GatherFuture::take_results` relies on this to convert the results vector in place.
+const _: () = assert!(size_of::<Option<Value>>() == size_of::<Value>());
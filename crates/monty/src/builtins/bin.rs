@@ -23,9 +23,8 @@ pub fn builtin_bin(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) -> Ru
 
     match value {
         Value::Int(n) => {
-            let abs_digits = format!("{:b}", n.unsigned_abs());
             let prefix = if *n < 0 { "-0b" } else { "0b" };
-            let heap_id = heap.allocate(HeapData::Str(Str::new(format!("{prefix}{abs_digits}"))))?;
+            let heap_id = heap.allocate(HeapData::Str(Str::new(format!("{prefix}{:b}", n.unsigned_abs()))))?;
             Ok(Value::Ref(heap_id))
         }
         Value::Bool(b) => {
@@ -48,9 +47,7 @@ pub fn builtin_bin(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) -> Ru
 
 /// Formats a BigInt as a binary string with '0b' prefix.
 fn format_bigint_bin(bi: &BigInt) -> String {
-    let is_negative = bi.is_negative();
-    let abs_bi = bi.abs();
-    let bin_digits = format!("{abs_bi:b}");
-    let prefix = if is_negative { "-0b" } else { "0b" };
-    format!("{prefix}{bin_digits}")
+    let prefix = if bi.is_negative() { "-0b" } else { "0b" };
+    // Format the magnitude by reference rather than cloning the digits with `abs()`
+    format!("{prefix}{:b}", bi.magnitude())
 }
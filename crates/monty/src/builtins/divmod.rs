@@ -9,9 +9,9 @@ use crate::{
     defer_drop,
     exception_private::{ExcType, RunResult, SimpleException},
     heap::{Heap, HeapData},
-    resource::{ResourceTracker, check_div_size},
+    resource::ResourceTracker,
     types::{LongInt, PyTrait, allocate_tuple},
-    value::{Value, floor_divmod},
+    value::{Value, floor_divmod, floor_divmod_i128},
 };
 
 /// Implementation of the divmod() builtin function.
@@ -32,18 +32,18 @@ pub fn builtin_divmod(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) ->
             } else if let Some((quot, rem)) = floor_divmod(*x, *y) {
                 Ok(allocate_tuple(smallvec![Value::Int(quot), Value::Int(rem)], heap)?)
             } else {
-                // Overflow - promote to BigInt
-                check_div_size(64, heap.tracker())?;
-                let (quot, rem) = bigint_floor_divmod(&BigInt::from(*x), &BigInt::from(*y));
-                let quot_val = LongInt::new(quot).into_value(heap)?;
-                let rem_val = LongInt::new(rem).into_value(heap)?;
-                Ok(allocate_tuple(smallvec![quot_val, rem_val], heap)?)
+                // Only i64::MIN / -1 overflows: the quotient is 2**63 and the remainder 0,
+                // which i128 holds without a BigInt division
+                let quot_val = LongInt::i128_into_value(-i128::from(*x), heap)?;
+                Ok(allocate_tuple(smallvec![quot_val, Value::Int(0)], heap)?)
             }
         }
         (Value::Int(x), Value::Ref(id)) => {
             if let HeapData::LongInt(li) = heap.get(*id) {
                 if li.is_zero() {
                     Err(ExcType::divmod_by_zero())
+                } else if let Some((quot, rem)) = li.to_i128().and_then(|d| floor_divmod_i128(i128::from(*x), d)) {
+                    i128_divmod_tuple(quot, rem, heap)
                 } else {
                     let x_bi = BigInt::from(*x);
                     let (quot, rem) = bigint_floor_divmod(&x_bi, li.inner());
@@ -65,6 +65,8 @@ pub fn builtin_divmod(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) ->
             if let HeapData::LongInt(li) = heap.get(*id) {
                 if *y == 0 {
                     Err(ExcType::divmod_by_zero())
+                } else if let Some((quot, rem)) = li.to_i128().and_then(|n| floor_divmod_i128(n, i128::from(*y))) {
+                    i128_divmod_tuple(quot, rem, heap)
                 } else {
                     let y_bi = BigInt::from(*y);
                     let (quot, rem) = bigint_floor_divmod(li.inner(), &y_bi);
@@ -83,22 +85,19 @@ pub fn builtin_divmod(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) ->
             }
         }
         (Value::Ref(id1), Value::Ref(id2)) => {
-            let x_bi = if let HeapData::LongInt(li) = heap.get(*id1) {
-                li.inner().clone()
-            } else {
-                let a_type = a.py_type(heap);
-                let b_type = b.py_type(heap);
-                return Err(SimpleException::new_msg(
-                    ExcType::TypeError,
-                    format!("unsupported operand type(s) for divmod(): '{a_type}' and '{b_type}'"),
-                )
-                .into());
-            };
-            if let HeapData::LongInt(li) = heap.get(*id2) {
-                if li.is_zero() {
+            // Divide the two heap values in place - the owned results end the borrows
+            // before heap mutation, so the dividend never needs copying
+            if let (HeapData::LongInt(li1), HeapData::LongInt(li2)) = (heap.get(*id1), heap.get(*id2)) {
+                if li2.is_zero() {
                     Err(ExcType::divmod_by_zero())
+                } else if let Some((quot, rem)) = li1
+                    .to_i128()
+                    .zip(li2.to_i128())
+                    .and_then(|(n, d)| floor_divmod_i128(n, d))
+                {
+                    i128_divmod_tuple(quot, rem, heap)
                 } else {
-                    let (quot, rem) = bigint_floor_divmod(&x_bi, li.inner());
+                    let (quot, rem) = bigint_floor_divmod(li1.inner(), li2.inner());
                     let quot_val = LongInt::new(quot).into_value(heap)?;
                     let rem_val = LongInt::new(rem).into_value(heap)?;
                     Ok(allocate_tuple(smallvec![quot_val, rem_val], heap)?)
@@ -154,6 +153,13 @@ pub fn builtin_divmod(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) ->
     }
 }
 
+/// Builds the `(quotient, remainder)` tuple for operands that were divided in i128.
+fn i128_divmod_tuple(quot: i128, rem: i128, heap: &mut Heap<impl ResourceTracker>) -> RunResult<Value> {
+    let quot_val = LongInt::i128_into_value(quot, heap)?;
+    let rem_val = LongInt::i128_into_value(rem, heap)?;
+    Ok(allocate_tuple(smallvec![quot_val, rem_val], heap)?)
+}
+
 /// Computes Python-style floor division and modulo for BigInts.
 ///
 /// Uses `div_mod_floor` from num_integer for correct floor semantics.
@@ -9,7 +9,7 @@ use crate::{
     intern::Interns,
     resource::ResourceTracker,
     types::{AttrCallResult, PyTrait},
-    value::Value,
+    value::{EitherStr, Value},
 };
 
 /// Implementation of the getattr() builtin function.
@@ -46,7 +46,22 @@ pub fn builtin_getattr(heap: &mut Heap<impl ResourceTracker>, args: ArgValues, i
         );
     };
 
-    match object.py_getattr(&attr, heap, interns) {
+    getattr_value(object, &attr, default, heap, interns)
+}
+
+/// Looks up `attr` on `object` with `getattr()` semantics, once the arguments are unpacked.
+///
+/// Shared by `builtin_getattr` and the VM's `GetattrConst`/`GetattrConstDefault` opcodes,
+/// which the compiler emits for `getattr(obj, 'name'[, default])` calls with a string
+/// literal name, skipping argument packing and the name type check entirely.
+pub(crate) fn getattr_value(
+    object: &Value,
+    attr: &EitherStr,
+    default: Option<&Value>,
+    heap: &mut Heap<impl ResourceTracker>,
+    interns: &Interns,
+) -> RunResult<Value> {
+    match object.py_getattr(attr, heap, interns) {
         Ok(AttrCallResult::Value(value)) => Ok(value),
         Ok(_) => {
             // getattr() only retrieves attribute values — OS calls, external calls,
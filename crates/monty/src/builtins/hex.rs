@@ -23,9 +23,8 @@ pub fn builtin_hex(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) -> Ru
 
     match value {
         Value::Int(n) => {
-            let abs_digits = format!("{:x}", n.unsigned_abs());
             let prefix = if *n < 0 { "-0x" } else { "0x" };
-            let heap_id = heap.allocate(HeapData::Str(Str::new(format!("{prefix}{abs_digits}"))))?;
+            let heap_id = heap.allocate(HeapData::Str(Str::new(format!("{prefix}{:x}", n.unsigned_abs()))))?;
             Ok(Value::Ref(heap_id))
         }
         Value::Bool(b) => {
@@ -48,9 +47,7 @@ pub fn builtin_hex(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) -> Ru
 
 /// Formats a BigInt as a hexadecimal string with '0x' prefix.
 fn format_bigint_hex(bi: &BigInt) -> String {
-    let is_negative = bi.is_negative();
-    let abs_bi = bi.abs();
-    let hex_digits = format!("{abs_bi:x}");
-    let prefix = if is_negative { "-0x" } else { "0x" };
-    format!("{prefix}{hex_digits}")
+    let prefix = if bi.is_negative() { "-0x" } else { "0x" };
+    // Format the magnitude by reference rather than cloning the digits with `abs()`
+    format!("{prefix}{:x}", bi.magnitude())
 }
@@ -34,6 +34,7 @@ mod zip;
 
 use std::{fmt::Write, str::FromStr};
 
+pub(crate) use getattr::getattr_value;
 use strum::{Display, EnumString, FromRepr, IntoStaticStr};
 
 use crate::{
@@ -76,10 +77,21 @@ impl Builtins {
     }
 
     /// Writes the Python repr() string for this callable to a formatter.
+    ///
+    /// Builtin function and exception names are static strings, so they are copied
+    /// straight into the writer rather than going through `format_args!`.
     pub fn py_repr_fmt<W: Write>(self, f: &mut W) -> std::fmt::Result {
         match self {
-            Self::Function(b) => write!(f, "<built-in function {b}>"),
-            Self::ExcType(e) => write!(f, "<class '{e}'>"),
+            Self::Function(b) => {
+                f.write_str("<built-in function ")?;
+                f.write_str(b.into())?;
+                f.write_char('>')
+            }
+            Self::ExcType(e) => {
+                f.write_str("<class '")?;
+                f.write_str(e.into())?;
+                f.write_str("'>")
+            }
             Self::Type(t) => write!(f, "<class '{t}'>"),
         }
     }
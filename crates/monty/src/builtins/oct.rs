@@ -23,9 +23,8 @@ pub fn builtin_oct(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) -> Ru
 
     match value {
         Value::Int(n) => {
-            let abs_digits = format!("{:o}", n.unsigned_abs());
             let prefix = if *n < 0 { "-0o" } else { "0o" };
-            let heap_id = heap.allocate(HeapData::Str(Str::new(format!("{prefix}{abs_digits}"))))?;
+            let heap_id = heap.allocate(HeapData::Str(Str::new(format!("{prefix}{:o}", n.unsigned_abs()))))?;
             Ok(Value::Ref(heap_id))
         }
         Value::Bool(b) => {
@@ -48,9 +47,7 @@ pub fn builtin_oct(heap: &mut Heap<impl ResourceTracker>, args: ArgValues) -> Ru
 
 /// Formats a BigInt as an octal string with '0o' prefix.
 fn format_bigint_oct(bi: &BigInt) -> String {
-    let is_negative = bi.is_negative();
-    let abs_bi = bi.abs();
-    let oct_digits = format!("{abs_bi:o}");
-    let prefix = if is_negative { "-0o" } else { "0o" };
-    format!("{prefix}{oct_digits}")
+    let prefix = if bi.is_negative() { "-0o" } else { "0o" };
+    // Format the magnitude by reference rather than cloning the digits with `abs()`
+    format!("{prefix}{:o}", bi.magnitude())
 }
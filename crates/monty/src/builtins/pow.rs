@@ -151,6 +151,10 @@ fn two_arg_pow(base: &Value, exp: &Value, heap: &mut Heap<impl ResourceTracker>)
         (Value::Ref(id), Value::Int(e)) => {
             // Clone to avoid borrow conflict with heap mutation
             let b_bi = if let HeapData::LongInt(li) = heap.get(*id) {
+                // Reject oversized results before copying the (possibly huge) base out of the heap
+                if let Ok(exp_u64) = u64::try_from(*e) {
+                    check_pow_size(li.bits(), exp_u64, heap.tracker())?;
+                }
                 li.inner().clone()
             } else {
                 return Err(ExcType::binary_type_error(
@@ -162,6 +166,12 @@ fn two_arg_pow(base: &Value, exp: &Value, heap: &mut Heap<impl ResourceTracker>)
             longint_pow_int(&b_bi, *e, heap)
         }
         (Value::Ref(id1), Value::Ref(id2)) => {
+            // Reject oversized results before copying either operand out of the heap
+            if let (HeapData::LongInt(b_li), HeapData::LongInt(e_li)) = (heap.get(*id1), heap.get(*id2))
+                && let Some(exp_u32) = e_li.to_u32()
+            {
+                check_pow_size(b_li.bits(), u64::from(exp_u32), heap.tracker())?;
+            }
             // Clone both to avoid borrow conflict with heap mutation
             let b_bi = if let HeapData::LongInt(li) = heap.get(*id1) {
                 li.inner().clone()
@@ -17,7 +17,7 @@ use super::{
 };
 use crate::{
     args::{ArgExprs, Kwarg},
-    builtins::Builtins,
+    builtins::{Builtins, BuiltinsFunctions},
     exception_private::ExcType,
     exception_public::{MontyException, StackFrame},
     expressions::{
@@ -1097,6 +1097,26 @@ impl<'a> Compiler<'a> {
     ///
     /// The `call_pos` is the position of the full call expression for proper traceback caret.
     fn compile_call(&mut self, callable: &Callable, args: &ArgExprs, call_pos: CodeRange) -> Result<(), CompileError> {
+        // `getattr(obj, 'name'[, default])` with a string literal name compiles to a
+        // dedicated opcode, skipping argument packing and the name type check
+        if let Callable::Builtin(Builtins::Function(BuiltinsFunctions::Getattr)) = callable
+            && let Some((object, name_id, default)) = const_getattr_args(args)
+            && let Ok(name_idx) = u16::try_from(name_id.index())
+        {
+            self.compile_expr(object)?;
+            if let Some(default) = default {
+                self.compile_expr(default)?;
+            }
+            self.code.set_location(call_pos, None);
+            let opcode = if default.is_some() {
+                Opcode::GetattrConstDefault
+            } else {
+                Opcode::GetattrConst
+            };
+            self.code.emit_u16(opcode, name_idx);
+            return Ok(());
+        }
+
         // Check if we can use the optimized CallBuiltinFunction path:
         // - Callable must be a builtin function (known at compile time)
         // - Arguments must be positional-only (Empty, One, Two, or Args)
@@ -2896,3 +2916,22 @@ fn cmp_operator_to_opcode(op: &CmpOperator) -> Opcode {
         CmpOperator::ModEq(_) => unreachable!("ModEq handled at call site"),
     }
 }
+
+/// Matches `getattr` call arguments of the form `(obj, 'name')` or `(obj, 'name', default)`.
+///
+/// Returns the object expression, the interned attribute name and the optional default
+/// expression when the name is a string literal, or `None` for any other argument shape.
+fn const_getattr_args(args: &ArgExprs) -> Option<(&ExprLoc, StringId, Option<&ExprLoc>)> {
+    let (object, name, default) = match args {
+        ArgExprs::Two(object, name) => (object, name, None),
+        ArgExprs::Args(args) => match args.as_slice() {
+            [object, name, default] => (object, name, Some(default)),
+            _ => return None,
+        },
+        _ => return None,
+    };
+    match name.expr {
+        Expr::Literal(Literal::Str(name_id)) => Some((object, name_id, default)),
+        _ => None,
+    }
+}
@@ -241,6 +241,15 @@ pub enum Opcode {
     LoadAttrImport,
     /// Pop value, pop obj, set obj.attr. Operand: u16 name_id.
     StoreAttr,
+    /// Pop obj, push `getattr(obj, name)`. Operand: u16 name_id.
+    ///
+    /// Emitted for calls to the builtin `getattr` whose name argument is a string literal,
+    /// avoiding argument packing and the runtime name type check.
+    GetattrConst,
+    /// Pop default, pop obj, push `getattr(obj, name, default)`. Operand: u16 name_id.
+    ///
+    /// Like `GetattrConst`, but returns `default` instead of raising if the lookup fails.
+    GetattrConstDefault,
     // NOTE: DeleteAttr removed - `del` statement not supported by parser
 
     // === Function Calls ===
@@ -411,13 +420,13 @@ impl Opcode {
             CallBuiltinType, CallFunction, CallFunctionExtended, CallFunctionKw, CheckExcMatch, ClearException,
             CompareEq, CompareGe, CompareGt, CompareIn, CompareIs, CompareIsNot, CompareLe, CompareLt, CompareModEq,
             CompareNe, CompareNotIn, DeleteLocal, DictMerge, DictSetItem, Dup, ForIter, FormatValue, GetIter,
-            InplaceAdd, InplaceAnd, InplaceDiv, InplaceFloorDiv, InplaceLShift, InplaceMod, InplaceMul, InplaceOr,
-            InplacePow, InplaceRShift, InplaceSub, InplaceXor, Jump, JumpIfFalse, JumpIfFalseOrPop, JumpIfTrue,
-            JumpIfTrueOrPop, ListAppend, ListExtend, ListToTuple, LoadAttr, LoadAttrImport, LoadCell, LoadConst,
-            LoadFalse, LoadGlobal, LoadLocal, LoadLocal0, LoadLocal1, LoadLocal2, LoadLocal3, LoadLocalW, LoadModule,
-            LoadNone, LoadSmallInt, LoadTrue, MakeClosure, MakeFunction, Nop, Pop, Raise, RaiseImportError, Reraise,
-            ReturnValue, Rot2, Rot3, SetAdd, StoreAttr, StoreCell, StoreGlobal, StoreLocal, StoreLocalW, StoreSubscr,
-            UnaryInvert, UnaryNeg, UnaryNot, UnaryPos, UnpackEx, UnpackSequence,
+            GetattrConst, GetattrConstDefault, InplaceAdd, InplaceAnd, InplaceDiv, InplaceFloorDiv, InplaceLShift,
+            InplaceMod, InplaceMul, InplaceOr, InplacePow, InplaceRShift, InplaceSub, InplaceXor, Jump, JumpIfFalse,
+            JumpIfFalseOrPop, JumpIfTrue, JumpIfTrueOrPop, ListAppend, ListExtend, ListToTuple, LoadAttr,
+            LoadAttrImport, LoadCell, LoadConst, LoadFalse, LoadGlobal, LoadLocal, LoadLocal0, LoadLocal1, LoadLocal2,
+            LoadLocal3, LoadLocalW, LoadModule, LoadNone, LoadSmallInt, LoadTrue, MakeClosure, MakeFunction, Nop, Pop,
+            Raise, RaiseImportError, Reraise, ReturnValue, Rot2, Rot3, SetAdd, StoreAttr, StoreCell, StoreGlobal,
+            StoreLocal, StoreLocalW, StoreSubscr, UnaryInvert, UnaryNeg, UnaryNot, UnaryPos, UnpackEx, UnpackSequence,
         };
         Some(match self {
             // Stack operations
@@ -471,6 +480,8 @@ impl Opcode {
             StoreSubscr => -3,              // pop 3, push 0
             LoadAttr | LoadAttrImport => 0, // pop 1, push 1
             StoreAttr => -2,                // pop 2, push 0
+            GetattrConst => 0,              // pop 1, push 1
+            GetattrConstDefault => -1,      // pop 2, push 1
 
             // Function calls - depend on arg count
             CallFunction | CallBuiltinFunction | CallBuiltinType | CallFunctionKw | CallAttr | CallAttrKw
@@ -211,30 +211,22 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
             }
         }
 
+        // Check if all items are already complete (only external futures, all resolved)
+        let all_complete = task_ids.is_empty() && pending_calls.is_empty();
+
         // Store task IDs and pending calls in the gather
         if let HeapDataMut::GatherFuture(gather_mut) = this.heap.get_mut(heap_id) {
+            gather_mut.pending_tasks = task_ids.len();
             gather_mut.task_ids = task_ids;
-            gather_mut.pending_calls.clone_from(&pending_calls);
+            gather_mut.pending_calls = pending_calls;
         }
 
-        // Check if all items are already complete (only external futures, all resolved)
-        let all_complete = {
-            if let HeapData::GatherFuture(gather) = this.heap.get(heap_id) {
-                gather.task_ids.is_empty() && gather.pending_calls.is_empty()
-            } else {
-                false
-            }
-        };
-
         if all_complete {
             // All external futures were already resolved - return results immediately
             // Steal results using mem::take - avoids refcount dance since we're dropping
             // the GatherFuture anyway via awaitable.drop_with_heap below
             let results: Vec<Value> = if let HeapDataMut::GatherFuture(gather) = this.heap.get_mut(heap_id) {
-                std::mem::take(&mut gather.results)
-                    .into_iter()
-                    .map(|r| r.expect("all results should be filled"))
-                    .collect()
+                gather.take_results()
             } else {
                 vec![]
             };
@@ -383,35 +375,33 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
 
         // If task belongs to a gather, store result and check if gather is complete
         if let Some(gid) = gather_id {
-            // Store result in gather.results at the correct index
-            if let Some(idx) = gather_result_idx
-                && let HeapDataMut::GatherFuture(gather) = self.heap.get_mut(gid)
-            {
-                gather.results[idx] = Some(result);
+            // Store result in gather.results at the correct index and count this task
+            // as done, checking whether all tasks are complete AND all external futures
+            // are resolved
+            let (all_complete, waiter) = if let HeapDataMut::GatherFuture(gather) = self.heap.get_mut(gid) {
+                if let Some(idx) = gather_result_idx {
+                    gather.results[idx] = Some(result);
+                } else {
+                    result.drop_with_heap(self.heap);
+                }
+                gather.pending_tasks = gather.pending_tasks.saturating_sub(1);
+                (
+                    gather.pending_tasks == 0 && gather.pending_calls.is_empty(),
+                    gather.waiter,
+                )
             } else {
                 result.drop_with_heap(self.heap);
-            }
-
-            // Extract gather metadata - clone task_ids since we need to check completion
-            // but gather might not be complete yet. We only take task_ids later when
-            // we know gather is complete and will be destroyed.
-            let (task_ids, waiter, pending_calls_empty) = if let HeapData::GatherFuture(gather) = self.heap.get(gid) {
-                (gather.task_ids.clone(), gather.waiter, gather.pending_calls.is_empty())
-            } else {
-                (vec![], None, true)
+                (false, None)
             };
 
-            // Check if all tasks are complete AND all external futures are resolved
-            let all_tasks_complete = task_ids.iter().all(|tid| {
-                matches!(
-                    self.scheduler().get_task(*tid).state,
-                    TaskState::Completed(_) | TaskState::Failed(_)
-                )
-            });
-            let all_external_resolved = pending_calls_empty;
-            let all_complete = all_tasks_complete && all_external_resolved;
-
             if all_complete {
+                // Take task_ids - the gather is complete and about to be destroyed
+                let task_ids = if let HeapDataMut::GatherFuture(gather) = self.heap.get_mut(gid) {
+                    std::mem::take(&mut gather.task_ids)
+                } else {
+                    vec![]
+                };
+
                 // First check if any task failed
                 let failed_task = task_ids
                     .iter()
@@ -439,10 +429,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
                 // (copy + inc_ref + dec_ref on gather drop). Since gather is being
                 // destroyed, we can take ownership of the values directly.
                 let results: Vec<Value> = if let HeapDataMut::GatherFuture(gather) = self.heap.get_mut(gid) {
-                    std::mem::take(&mut gather.results)
-                        .into_iter()
-                        .map(|r| r.expect("all results should be filled when gather is complete"))
-                        .collect()
+                    gather.take_results()
                 } else {
                     vec![]
                 };
@@ -779,30 +766,22 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
             // Remove from scheduler's pending_calls so it doesn't appear in get_pending_call_ids()
             self.scheduler_mut().remove_pending_call(call_id);
             // Store result directly in gather (move, not clone) and check completion
-            let (pending_empty, task_ids, waiter) =
+            let (pending_empty, all_tasks_complete, waiter) =
                 if let HeapDataMut::GatherFuture(gather) = self.heap.get_mut(gather_id) {
                     gather.results[result_idx] = Some(value); // Move value directly, no clone needed
                     // Remove from pending_calls
                     gather.pending_calls.retain(|&cid| cid != call_id);
-                    // Take task_ids to avoid clone - we're checking completion so gather may be destroyed
                     (
                         gather.pending_calls.is_empty(),
-                        std::mem::take(&mut gather.task_ids),
+                        gather.pending_tasks == 0,
                         gather.waiter,
                     )
                 } else {
-                    (true, vec![], None)
+                    (true, true, None)
                 };
 
             // Check if gather is now complete (all external futures resolved and all tasks complete)
             if pending_empty {
-                let all_tasks_complete = task_ids.is_empty()
-                    || task_ids.iter().all(|tid| {
-                        matches!(
-                            self.scheduler().get_task(*tid).state,
-                            TaskState::Completed(_) | TaskState::Failed(_)
-                        )
-                    });
                 if all_tasks_complete {
                     // Gather is complete - build result and push to waiter's stack
                     if let Some(waiter_id) = waiter {
@@ -811,10 +790,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
                         // destroyed, we can take ownership of the values directly.
                         let results: Vec<Value> =
                             if let HeapDataMut::GatherFuture(gather) = self.heap.get_mut(gather_id) {
-                                std::mem::take(&mut gather.results)
-                                    .into_iter()
-                                    .map(|r| r.expect("all results should be filled when gather is complete"))
-                                    .collect()
+                                gather.take_results()
                             } else {
                                 vec![]
                             };
@@ -2,6 +2,7 @@
 
 use super::VM;
 use crate::{
+    builtins::getattr_value,
     bytecode::vm::CallResult,
     defer_drop,
     exception_private::{ExcType, RunError},
@@ -61,4 +62,22 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
         // py_set_attr takes ownership of value and drops it on error
         obj.py_set_attr(name_id, value, this.heap, this.interns)
     }
+
+    /// Pops the object (and default, if `has_default`) and pushes `getattr(obj, name[, default])`.
+    ///
+    /// Handles the `GetattrConst`/`GetattrConstDefault` opcodes emitted for `getattr` calls
+    /// with a string literal name.
+    pub(super) fn getattr_const(&mut self, name_id: StringId, has_default: bool) -> Result<(), RunError> {
+        let this = self;
+
+        let default = if has_default { Some(this.pop()) } else { None };
+        defer_drop!(default, this);
+        let obj = this.pop();
+        defer_drop!(obj, this);
+
+        let attr = EitherStr::Interned(name_id);
+        let value = getattr_value(obj, &attr, default.as_ref(), this.heap, this.interns)?;
+        this.push(value);
+        Ok(())
+    }
 }
@@ -11,7 +11,11 @@ use crate::{
 
 impl<T: ResourceTracker> VM<'_, '_, T> {
     /// Equality comparison.
-    pub(super) fn compare_eq(&mut self) -> Result<(), RunError> {
+    ///
+    /// Like the other comparison helpers, this pops both operands and returns the
+    /// result rather than pushing it, so the run loop can branch on it directly
+    /// when a conditional jump follows.
+    pub(super) fn compare_eq(&mut self) -> Result<bool, RunError> {
         let this = self;
 
         let rhs = this.pop();
@@ -19,13 +23,11 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
         let lhs = this.pop();
         defer_drop!(lhs, this);
 
-        let result = lhs.py_eq(rhs, this.heap, this.interns)?;
-        this.push(Value::Bool(result));
-        Ok(())
+        Ok(lhs.py_eq(rhs, this.heap, this.interns)?)
     }
 
     /// Inequality comparison.
-    pub(super) fn compare_ne(&mut self) -> Result<(), RunError> {
+    pub(super) fn compare_ne(&mut self) -> Result<bool, RunError> {
         let this = self;
 
         let rhs = this.pop();
@@ -33,13 +35,11 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
         let lhs = this.pop();
         defer_drop!(lhs, this);
 
-        let result = !lhs.py_eq(rhs, this.heap, this.interns)?;
-        this.push(Value::Bool(result));
-        Ok(())
+        Ok(!lhs.py_eq(rhs, this.heap, this.interns)?)
     }
 
     /// Ordering comparison with a predicate.
-    pub(super) fn compare_ord<F>(&mut self, check: F) -> Result<(), RunError>
+    pub(super) fn compare_ord<F>(&mut self, check: F) -> Result<bool, RunError>
     where
         F: FnOnce(std::cmp::Ordering) -> bool,
     {
@@ -50,9 +50,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
         let lhs = this.pop();
         defer_drop!(lhs, this);
 
-        let result = lhs.py_cmp(rhs, this.heap, this.interns)?.is_some_and(check);
-        this.push(Value::Bool(result));
-        Ok(())
+        Ok(lhs.py_cmp(rhs, this.heap, this.interns)?.is_some_and(check))
     }
 
     /// Identity comparison (is/is not).
@@ -64,7 +62,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
     /// - Interned string/bytes index for InternString/InternBytes
     /// - HeapId for heap-allocated values (Ref)
     /// - Value-based hashing for immediate types (Int, Float, Function, etc.)
-    pub(super) fn compare_is(&mut self, negate: bool) {
+    pub(super) fn compare_is(&mut self, negate: bool) -> bool {
         let this = self;
 
         let rhs = this.pop();
@@ -72,12 +70,11 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
         let lhs = this.pop();
         defer_drop!(lhs, this);
 
-        let result = lhs.is(rhs);
-        this.push(Value::Bool(if negate { !result } else { result }));
+        lhs.is(rhs) != negate
     }
 
     /// Membership test (in/not in).
-    pub(super) fn compare_in(&mut self, negate: bool) -> Result<(), RunError> {
+    pub(super) fn compare_in(&mut self, negate: bool) -> Result<bool, RunError> {
         let this = self;
 
         let container = this.pop(); // container (rhs)
@@ -86,8 +83,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
         defer_drop!(item, this);
 
         let contained = container.py_contains(item, this.heap, this.interns)?;
-        this.push(Value::Bool(if negate { !contained } else { contained }));
-        Ok(())
+        Ok(contained != negate)
     }
 
     /// Modulo equality comparison: a % b == k
@@ -98,7 +94,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
     ///
     /// Uses a fast path for Int/Float types via `py_mod_eq`, and falls back to
     /// computing `py_mod` then comparing with `py_eq` for other types (e.g., LongInt).
-    pub(super) fn compare_mod_eq(&mut self, k: &Value) -> Result<(), RunError> {
+    pub(super) fn compare_mod_eq(&mut self, k: &Value) -> Result<bool, RunError> {
         let this = self;
 
         let rhs = this.pop(); // divisor (b)
@@ -114,8 +110,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
 
         if let Some(is_equal) = mod_result {
             // Fast path succeeded
-            this.push(Value::Bool(is_equal));
-            Ok(())
+            Ok(is_equal)
         } else {
             // Fallback: compute py_mod then compare with py_eq
             // This handles LongInt and other Ref types
@@ -135,9 +130,7 @@ impl<T: ResourceTracker> VM<'_, '_, T> {
                     };
                     defer_drop!(k_value, this);
 
-                    let is_equal = v.py_eq(k_value, this.heap, this.interns)?;
-                    this.push(Value::Bool(is_equal));
-                    Ok(())
+                    Ok(v.py_eq(k_value, this.heap, this.interns)?)
                 }
                 Ok(None) => Err(ExcType::type_error("unsupported operand type(s) for %")),
                 Err(e) => Err(e),
@@ -151,6 +151,45 @@ macro_rules! jump_relative {
     }};
 }
 
+/// Pushes the `bool` result of a comparison, or branches on it directly when the next
+/// instruction is a `JumpIfTrue`/`JumpIfFalse` that would immediately pop it.
+///
+/// `if a < b:` and `while i < n:` compile to a compare followed by a conditional jump.
+/// Taking the jump here skips pushing a `Value::Bool`, popping it again, re-testing
+/// its truthiness and a full trip through the dispatch loop for the jump.
+macro_rules! push_or_branch {
+    ($self:expr, $cached_frame:ident, $result:expr) => {{
+        let result: bool = $result;
+        let next = $cached_frame.code.bytecode().get($cached_frame.ip).copied();
+        let jump_when = match next.map(Opcode::try_from) {
+            Some(Ok(Opcode::JumpIfTrue)) => Some(true),
+            Some(Ok(Opcode::JumpIfFalse)) => Some(false),
+            _ => None,
+        };
+        if let Some(jump_when) = jump_when {
+            // Consume the jump instruction and its operand as if it had been dispatched
+            $cached_frame.ip += 1;
+            let offset = fetch_i16!($cached_frame);
+            if result == jump_when {
+                jump_relative!($cached_frame.ip, offset);
+            }
+        } else {
+            $self.push(Value::Bool(result));
+        }
+    }};
+}
+
+/// Runs a fallible comparison and hands its result to `push_or_branch!`, routing
+/// errors through the exception handler.
+macro_rules! compare_and_branch {
+    ($self:expr, $cached_frame:ident, $compare:expr) => {
+        match $compare {
+            Ok(result) => push_or_branch!($self, $cached_frame, result),
+            Err(e) => catch_sync!($self, $cached_frame, e),
+        }
+    };
+}
+
 /// Handles the result of a call operation that returns `CallResult`.
 ///
 /// This macro eliminates the repetitive pattern of matching on `CallResult`
@@ -884,20 +923,20 @@ impl<'a, 'p, T: ResourceTracker> VM<'a, 'p, T> {
                 }
                 Opcode::BinaryMatMul => try_catch_sync!(self, cached_frame, self.binary_matmul()),
                 // Comparison Operations
-                Opcode::CompareEq => try_catch_sync!(self, cached_frame, self.compare_eq()),
-                Opcode::CompareNe => try_catch_sync!(self, cached_frame, self.compare_ne()),
-                Opcode::CompareLt => try_catch_sync!(self, cached_frame, self.compare_ord(Ordering::is_lt)),
-                Opcode::CompareLe => try_catch_sync!(self, cached_frame, self.compare_ord(Ordering::is_le)),
-                Opcode::CompareGt => try_catch_sync!(self, cached_frame, self.compare_ord(Ordering::is_gt)),
-                Opcode::CompareGe => try_catch_sync!(self, cached_frame, self.compare_ord(Ordering::is_ge)),
-                Opcode::CompareIs => self.compare_is(false),
-                Opcode::CompareIsNot => self.compare_is(true),
-                Opcode::CompareIn => try_catch_sync!(self, cached_frame, self.compare_in(false)),
-                Opcode::CompareNotIn => try_catch_sync!(self, cached_frame, self.compare_in(true)),
+                Opcode::CompareEq => compare_and_branch!(self, cached_frame, self.compare_eq()),
+                Opcode::CompareNe => compare_and_branch!(self, cached_frame, self.compare_ne()),
+                Opcode::CompareLt => compare_and_branch!(self, cached_frame, self.compare_ord(Ordering::is_lt)),
+                Opcode::CompareLe => compare_and_branch!(self, cached_frame, self.compare_ord(Ordering::is_le)),
+                Opcode::CompareGt => compare_and_branch!(self, cached_frame, self.compare_ord(Ordering::is_gt)),
+                Opcode::CompareGe => compare_and_branch!(self, cached_frame, self.compare_ord(Ordering::is_ge)),
+                Opcode::CompareIs => push_or_branch!(self, cached_frame, self.compare_is(false)),
+                Opcode::CompareIsNot => push_or_branch!(self, cached_frame, self.compare_is(true)),
+                Opcode::CompareIn => compare_and_branch!(self, cached_frame, self.compare_in(false)),
+                Opcode::CompareNotIn => compare_and_branch!(self, cached_frame, self.compare_in(true)),
                 Opcode::CompareModEq => {
                     let const_idx = fetch_u16!(cached_frame);
                     let k = cached_frame.code.constants().get(const_idx);
-                    try_catch_sync!(self, cached_frame, self.compare_mod_eq(k));
+                    compare_and_branch!(self, cached_frame, self.compare_mod_eq(k));
                 }
                 // Unary Operations
                 Opcode::UnaryNot => {
@@ -1108,6 +1147,16 @@ impl<'a, 'p, T: ResourceTracker> VM<'a, 'p, T> {
                     let name_id = StringId::from_index(name_idx);
                     try_catch_sync!(self, cached_frame, self.store_attr(name_id));
                 }
+                Opcode::GetattrConst => {
+                    let name_idx = fetch_u16!(cached_frame);
+                    let name_id = StringId::from_index(name_idx);
+                    try_catch_sync!(self, cached_frame, self.getattr_const(name_id, false));
+                }
+                Opcode::GetattrConstDefault => {
+                    let name_idx = fetch_u16!(cached_frame);
+                    let name_id = StringId::from_index(name_idx);
+                    try_catch_sync!(self, cached_frame, self.getattr_const(name_id, true));
+                }
                 // Control Flow - use cached_frame.ip directly for jumps
                 Opcode::Jump => {
                     let offset = fetch_i16!(cached_frame);
@@ -59,6 +59,10 @@ pub(crate) struct Task {
     pub id: TaskId,
     /// Serialized call frames for this task's execution.
     /// Empty for the main task (which uses VM's frames directly).
+    ///
+    /// This is also the task's recursion depth record: while the task is suspended its
+    /// `frames.len() - 1` non-root frames are subtracted from the heap's global depth
+    /// counter, and added back when it resumes, so gathered tasks never share a budget.
     pub frames: Vec<SerializedTaskFrame>,
     /// Operand stack for this task.
     /// Empty for the main task (which uses VM's stack directly).
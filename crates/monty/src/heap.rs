@@ -4,14 +4,14 @@ use std::{
     collections::hash_map::DefaultHasher,
     fmt::Write,
     hash::{Hash, Hasher},
-    mem::{ManuallyDrop, size_of},
+    mem::{ManuallyDrop, size_of, take},
     ptr::addr_of,
     vec,
 };
 
 use ahash::AHashSet;
 use num_integer::Integer;
-use smallvec::SmallVec;
+use smallvec::{Array, SmallVec};
 
 use crate::{
     args::ArgValues,
@@ -503,7 +503,7 @@ impl PyTrait for HeapData {
             // Strings return their value directly without quotes
             Self::Str(s) => s.py_str(heap, interns),
             // LongInt returns its string representation
-            Self::LongInt(li) => Cow::Owned(li.to_string()),
+            Self::LongInt(li) => Cow::Owned(li.to_decimal_string()),
             // Exceptions return just the message (or empty string if no message)
             Self::Exception(e) => Cow::Owned(e.py_str()),
             // Paths return the path string without the PosixPath() wrapper
@@ -829,6 +829,9 @@ pub(crate) struct Heap<T: ResourceTracker> {
     /// Uses `Cell` for interior mutability so that methods with only `&Heap`
     /// (like `py_repr_fmt`) can still increment/decrement the depth counter.
     recursion_depth: Cell<usize>,
+    /// Scratch work stack reused by `dec_ref`, so freeing a container does not
+    /// allocate a fresh stack each time. Always empty between calls; not serialized.
+    dec_ref_stack: Vec<HeapId>,
 }
 
 impl<T: ResourceTracker + serde::Serialize> serde::Serialize for Heap<T> {
@@ -862,6 +865,7 @@ impl<'de, T: ResourceTracker + serde::Deserialize<'de>> serde::Deserialize<'de>
             may_have_cycles: fields.may_have_cycles,
             allocations_since_gc: fields.allocations_since_gc,
             recursion_depth: Cell::new(0),
+            dec_ref_stack: Vec::new(),
         })
     }
 }
@@ -892,6 +896,12 @@ macro_rules! restore_data {
     }};
 }
 
+/// Largest `dec_ref` work stack capacity kept around for reuse between calls.
+///
+/// Freeing a huge list grows the stack to its length; holding on to that would pin
+/// the memory for the rest of the run, so oversized stacks are dropped instead.
+const DEC_REF_STACK_RETAIN: usize = 1024;
+
 /// GC interval - run GC every 100,000 applicable allocations.
 ///
 /// This is intentionally infrequent to minimize overhead while still
@@ -910,6 +920,7 @@ impl<T: ResourceTracker> Heap<T> {
             may_have_cycles: false,
             allocations_since_gc: 0,
             recursion_depth: Cell::new(0),
+            dec_ref_stack: Vec::new(),
         };
         // TBC: should the empty tuple contribute to the resource limits?
         // If not, can just place it in `entries` directly without going through `allocate()`.
@@ -1103,7 +1114,9 @@ impl<T: ResourceTracker> Heap<T> {
     /// Panics if the value ID is invalid or the value has already been freed.
     pub fn dec_ref(&mut self, id: HeapId) {
         let mut current_id = id;
-        let mut work_stack = Vec::new();
+        // Borrow the reusable stack for the duration of this call (it stays empty when
+        // only refcounts are decremented, and keeps its capacity for the next free).
+        let mut work_stack = take(&mut self.dec_ref_stack);
         loop {
             let slot = self
                 .entries
@@ -1133,6 +1146,10 @@ impl<T: ResourceTracker> Heap<T> {
             };
             current_id = next_id;
         }
+        // Keep the buffer for reuse unless freeing a very wide container grew it a lot
+        if work_stack.capacity() <= DEC_REF_STACK_RETAIN {
+            self.dec_ref_stack = work_stack;
+        }
     }
 
     /// Returns an immutable reference to the heap data stored at the given ID.
@@ -1200,9 +1217,21 @@ impl<T: ResourceTracker> Heap<T> {
             return Ok(Some(hash));
         }
 
+        // Nested tuples are hashed bottom-up first, so hashing this one only reads
+        // cached element hashes instead of recursing once per nesting level.
+        if matches!(entry.data, Some(HeapData::Tuple(_) | HeapData::NamedTuple(_))) {
+            self.hash_nested_tuples_first(id, interns)?;
+        }
+
         // Compute hash lazily - need to temporarily take data to avoid borrow conflict.
         // IMPORTANT: data must be restored to the entry on ALL paths (including errors)
         // to avoid dropping HeapData containing Value::Ref without proper cleanup.
+        let entry = self
+            .entries
+            .get_mut(id.index())
+            .expect("Heap::get_or_compute_hash: slot missing")
+            .as_mut()
+            .expect("Heap::get_or_compute_hash: object already freed");
         let mut data = entry.data.take().expect("Heap::get_or_compute_hash: data borrowed");
         let hash = data.to_mut().compute_hash_if_immutable(self, interns);
 
@@ -1224,6 +1253,69 @@ impl<T: ResourceTracker> Heap<T> {
         Ok(hash)
     }
 
+    /// Computes and caches the hashes of all not-yet-hashed tuples nested inside the
+    /// tuple `id`, deepest first, using an explicit stack.
+    ///
+    /// Afterwards every tuple element of `id` has a cached hash, so hashing a 10,000-deep
+    /// `((((x,),),),)` chain needs bounded Rust stack rather than one frame (and one
+    /// recursion-limit level) per nesting level. Shared sub-tuples are hashed once: an
+    /// entry is skipped as soon as its hash is known.
+    fn hash_nested_tuples_first(&mut self, id: HeapId, interns: &Interns) -> Result<(), ResourceError> {
+        // (tuple id, whether its children have already been pushed)
+        let mut stack: Vec<(HeapId, bool)> = Vec::new();
+        self.push_unhashed_tuple_children(id, &mut stack);
+        while let Some((current, expanded)) = stack.pop() {
+            if self.hash_state(current) != HashState::Unknown {
+                continue;
+            }
+            if expanded {
+                self.get_or_compute_hash(current, interns)?;
+            } else {
+                stack.push((current, true));
+                self.push_unhashed_tuple_children(current, &mut stack);
+            }
+        }
+        Ok(())
+    }
+
+    /// Pushes the elements of tuple `id` that are themselves tuples without a known hash.
+    ///
+    /// Does nothing if `id` is not a tuple or its data is currently borrowed.
+    fn push_unhashed_tuple_children(&self, id: HeapId, stack: &mut Vec<(HeapId, bool)>) {
+        let items = match self.entry(id).data.as_ref() {
+            Some(HeapData::Tuple(t)) => t.as_slice(),
+            Some(HeapData::NamedTuple(nt)) => nt.as_vec().as_slice(),
+            _ => return,
+        };
+        for item in items {
+            if let Value::Ref(child) = item {
+                let child_entry = self.entry(*child);
+                if child_entry.hash_state == HashState::Unknown
+                    && matches!(child_entry.data, Some(HeapData::Tuple(_) | HeapData::NamedTuple(_)))
+                {
+                    stack.push((*child, false));
+                }
+            }
+        }
+    }
+
+    /// Returns the hash caching state of the entry at `id`.
+    fn hash_state(&self, id: HeapId) -> HashState {
+        self.entry(id).hash_state
+    }
+
+    /// Returns the live heap entry at `id`.
+    ///
+    /// # Panics
+    /// Panics if the value ID is invalid or the value has already been freed.
+    fn entry(&self, id: HeapId) -> &HeapValue {
+        self.entries
+            .get(id.index())
+            .expect("Heap::entry: slot missing")
+            .as_ref()
+            .expect("Heap::entry: object already freed")
+    }
+
     /// Calls an attribute on the heap entry, returning an `AttrCallResult` that may signal
     /// OS, external, or method calls.
     ///
@@ -1395,7 +1487,9 @@ impl<T: ResourceTracker> Heap<T> {
     pub fn mult_ref_by_i64(&mut self, id: HeapId, int_val: i64) -> RunResult<Option<Value>> {
         if let HeapData::LongInt(li) = self.get(id) {
             check_mult_size(li.bits(), i64_bits(int_val), &self.tracker)?;
-            let result = LongInt::new(li.inner().clone()) * LongInt::from(int_val);
+            // Scalar multiply: one copy of the operand scaled in place, rather than a copy
+            // plus a general BigInt * BigInt product into a third buffer
+            let result = LongInt::new(li.inner() * int_val);
             Ok(Some(result.into_value(self)?))
         } else {
             let count = i64_to_repeat_count(int_val)?;
@@ -1553,6 +1647,16 @@ impl<T: ResourceTracker> Heap<T> {
             }
         }
 
+        // Correct drift in the tracker's memory total now that only live objects remain
+        self.tracker.on_reconcile(|| {
+            self.entries
+                .iter()
+                .flatten()
+                .filter_map(|value| value.data.as_ref())
+                .map(|data| data.py_estimate_size())
+                .sum()
+        });
+
         // Reset cycle flag after GC - cycles have been collected
         self.may_have_cycles = false;
         self.allocations_since_gc = 0;
@@ -1830,6 +1934,17 @@ impl<U: DropWithHeap> DropWithHeap for Vec<U> {
     }
 }
 
+impl<A: Array> DropWithHeap for SmallVec<A>
+where
+    A::Item: DropWithHeap,
+{
+    fn drop_with_heap<T: ResourceTracker>(self, heap: &mut Heap<T>) {
+        for value in self {
+            value.drop_with_heap(heap);
+        }
+    }
+}
+
 impl<U: DropWithHeap> DropWithHeap for vec::IntoIter<U> {
     fn drop_with_heap<T: ResourceTracker>(self, heap: &mut Heap<T>) {
         for value in self {
@@ -20,7 +20,7 @@ use crate::{
         AttrCallResult, Bytes, Dataclass, Dict, FrozenSet, List, LongInt, Module, MontyIter, NamedTuple, Path, PyTrait,
         Range, Set, Slice, Str, Tuple, Type,
     },
-    value::{EitherStr, Value},
+    value::{EitherStr, Value, floor_divmod_i128},
 };
 
 /// Mutable reference to `HeapData` inner values
@@ -170,11 +170,8 @@ impl HeapDataMut<'_> {
                 b.as_slice().hash(&mut hasher);
                 Ok(Some(hasher.finish()))
             }
-            Self::FrozenSet(fs) => {
-                // FrozenSet hash is XOR of element hashes (order-independent)
-                // Recursion depth is checked inside compute_hash
-                fs.compute_hash(heap, interns)
-            }
+            // FrozenSet hash is XOR of the stored element hashes (order-independent)
+            Self::FrozenSet(fs) => Ok(Some(fs.compute_hash())),
             Self::Tuple(t) => {
                 let token = heap.incr_recursion_depth()?;
                 crate::defer_drop!(token, heap);
@@ -525,7 +522,7 @@ impl PyTrait for HeapDataMut<'_> {
             // Strings return their value directly without quotes
             Self::Str(s) => s.py_str(heap, interns),
             // LongInt returns its string representation
-            Self::LongInt(li) => Cow::Owned(li.to_string()),
+            Self::LongInt(li) => Cow::Owned(li.to_decimal_string()),
             // Exceptions return just the message (or empty string if no message)
             Self::Exception(e) => Cow::Owned(e.py_str()),
             // Paths return the path string without the PosixPath() wrapper
@@ -548,6 +545,11 @@ impl PyTrait for HeapDataMut<'_> {
             (Self::Tuple(a), Self::Tuple(b)) => a.py_add(b, heap, interns),
             (Self::Dict(a), Self::Dict(b)) => a.py_add(b, heap, interns),
             (Self::LongInt(a), Self::LongInt(b)) => {
+                if let (Some(x), Some(y)) = (a.to_i128(), b.to_i128())
+                    && let Some(sum) = x.checked_add(y)
+                {
+                    return Ok(Some(LongInt::i128_into_value(sum, heap)?));
+                }
                 let bi = a.inner() + b.inner();
                 Ok(LongInt::new(bi).into_value(heap).map(Some)?)
             }
@@ -570,6 +572,16 @@ impl PyTrait for HeapDataMut<'_> {
             (Self::Set(a), Self::Set(b)) => a.py_sub(b, heap),
             (Self::FrozenSet(a), Self::FrozenSet(b)) => a.py_sub(b, heap),
             (Self::LongInt(a), Self::LongInt(b)) => {
+                if let (Some(x), Some(y)) = (a.to_i128(), b.to_i128())
+                    && let Some(diff) = x.checked_sub(y)
+                {
+                    return Ok(Some(LongInt::i128_into_value(diff, heap)?));
+                }
+                // x - x (or two equal values) is 0: compare the digits rather than
+                // subtracting them into a result that immediately demotes
+                if a == b {
+                    return Ok(Some(Value::Int(0)));
+                }
                 let bi = a.inner() - b.inner();
                 Ok(LongInt::new(bi).into_value(heap).map(Some)?)
             }
@@ -592,6 +604,8 @@ impl PyTrait for HeapDataMut<'_> {
             (Self::LongInt(a), Self::LongInt(b)) => {
                 if b.is_zero() {
                     Err(crate::exception_private::ExcType::zero_division().into())
+                } else if let Some((_, rem)) = a.to_i128().zip(b.to_i128()).and_then(|(n, d)| floor_divmod_i128(n, d)) {
+                    Ok(Some(LongInt::i128_into_value(rem, heap)?))
                 } else {
                     let bi = a.inner().mod_floor(b.inner());
                     Ok(LongInt::new(bi).into_value(heap).map(Some)?)
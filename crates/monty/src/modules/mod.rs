@@ -97,8 +97,20 @@ impl ModuleFunctions {
         }
     }
 
+    /// Returns the function's name as a static string (e.g. `"gather"`).
+    pub fn name(self) -> &'static str {
+        match self {
+            Self::Asyncio(func) => func.into(),
+            Self::Os(func) => func.into(),
+        }
+    }
+
     /// Writes the Python repr() string for this function to a formatter.
+    ///
+    /// The name is copied from a static string; only the id goes through formatting.
     pub fn py_repr_fmt<W: Write>(self, f: &mut W, py_id: usize) -> std::fmt::Result {
-        write!(f, "<function {self} at 0x{py_id:x}>")
+        f.write_str("<function ")?;
+        f.write_str(self.name())?;
+        write!(f, " at 0x{py_id:x}>")
     }
 }
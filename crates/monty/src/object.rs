@@ -284,7 +284,7 @@ impl MontyObject {
                     .collect();
                 let dict = Dict::from_pairs(pairs?, heap, interns)
                     .map_err(|_| InvalidInputError::invalid_type("unhashable dataclass attr keys"))?;
-                let dc = Dataclass::new(name, type_id, field_names, dict, frozen);
+                let dc = Dataclass::new(name, type_id, field_names, dict, frozen, heap, interns);
                 Ok(Value::Ref(heap.allocate(HeapData::Dataclass(dc))?))
             }
             Self::Path(s) => Ok(Value::Ref(heap.allocate(HeapData::Path(Path::new(s)))?)),
@@ -626,7 +626,7 @@ impl MontyObject {
                 f.write_str(name)?;
                 f.write_char('(')?;
                 let mut first = true;
-                for field_name in field_names {
+                for (pos, field_name) in field_names.iter().enumerate() {
                     if !first {
                         f.write_str(", ")?;
                     }
@@ -634,8 +634,7 @@ impl MontyObject {
                     f.write_str(field_name)?;
                     f.write_char('=')?;
                     // Look up value in attrs
-                    let key = Self::String(field_name.clone());
-                    if let Some(value) = attrs.iter().find(|(k, _)| k == &key).map(|(_, v)| v) {
+                    if let Some(value) = attrs.get_str_hinted(field_name, pos) {
                         value.repr_fmt(f)?;
                     } else {
                         f.write_str("<?>")?;
@@ -1012,4 +1011,16 @@ impl DictPairs {
     fn iter(&self) -> impl Iterator<Item = &(MontyObject, MontyObject)> {
         self.0.iter()
     }
+
+    /// Returns the value for the string key `key`, checking the pair at `hint` first.
+    ///
+    /// Dataclass attrs are normally stored in field order, so the hint usually hits
+    /// and the linear scan is skipped.
+    fn get_str_hinted(&self, key: &str, hint: usize) -> Option<&MontyObject> {
+        let is_key = |k: &MontyObject| matches!(k, MontyObject::String(s) if s == key);
+        match self.0.get(hint) {
+            Some((k, v)) if is_key(k) => Some(v),
+            _ => self.0.iter().find(|(k, _)| is_key(k)).map(|(_, v)| v),
+        }
+    }
 }
@@ -613,6 +613,23 @@ impl<'a> Parser<'a> {
             AstExpr::BinOp(ast::ExprBinOp {
                 left, op, right, range, ..
             }) => {
+                // Fold `'lit' + 'lit'` into a single interned literal so that e.g. `hash('te' + 'st')`
+                // or `getattr(x, 'na' + 'me')` never builds the concatenation at runtime.
+                // Only direct literal operands are folded, which keeps the interned bytes linear
+                // in the source size (chains like `'a' + 'b' + 'c'` only fold their first pair).
+                if op == AstOperator::Add
+                    && let (AstExpr::StringLiteral(l), AstExpr::StringLiteral(r)) = (&*left, &*right)
+                {
+                    let (l, r) = (l.value.to_str(), r.value.to_str());
+                    let mut folded = String::with_capacity(l.len() + r.len());
+                    folded.push_str(l);
+                    folded.push_str(r);
+                    let string_id = self.interner.intern(&folded);
+                    return Ok(ExprLoc::new(
+                        self.convert_range(range),
+                        Expr::Literal(Literal::Str(string_id)),
+                    ));
+                }
                 let left = Box::new(self.parse_expression(*left)?);
                 let right = Box::new(self.parse_expression(*right)?);
                 Ok(ExprLoc {
@@ -69,14 +69,6 @@ pub fn check_lshift_size(
     check_estimated_size(estimate_bits_to_bytes(value_bits.saturating_add(shift_amount)), tracker)
 }
 
-/// Pre-checks that an integer division overflow promotion won't exceed resource limits.
-///
-/// Division results are bounded by the dividend size, but we still check for consistency
-/// with other BigInt promotion paths.
-pub fn check_div_size(dividend_bits: u64, tracker: &impl ResourceTracker) -> Result<(), ResourceError> {
-    check_estimated_size(estimate_bits_to_bytes(dividend_bits), tracker)
-}
-
 /// Checks an estimated result size against the resource tracker.
 ///
 /// Only calls the tracker when the estimate exceeds `LARGE_RESULT_THRESHOLD`
@@ -212,6 +204,18 @@ pub trait ResourceTracker: fmt::Debug {
     /// * `size` - Size in bytes of the freed allocation
     fn on_free(&mut self, get_size: impl FnOnce() -> usize);
 
+    /// Called after garbage collection with the estimated size of every live heap object.
+    ///
+    /// Allocation-time estimates drift as containers grow in place (e.g. `list.append`
+    /// never allocates a new heap entry), so the running total can undercount what is
+    /// actually held. Trackers that enforce a memory limit should raise their total to at
+    /// least `get_live_bytes()`; the next allocation is then checked against the corrected
+    /// figure.
+    ///
+    /// # Arguments
+    /// * `get_live_bytes` - Returns the summed size estimate of all live heap objects
+    fn on_reconcile(&mut self, get_live_bytes: impl FnOnce() -> usize);
+
     /// Called periodically (at statement boundaries) to check time limits.
     ///
     /// Returns `Ok(())` if within time limit, or `Err(ResourceError::Time)`
@@ -260,6 +264,9 @@ impl ResourceTracker for NoLimitTracker {
     #[inline]
     fn on_free(&mut self, _: impl FnOnce() -> usize) {}
 
+    #[inline]
+    fn on_reconcile(&mut self, _: impl FnOnce() -> usize) {}
+
     #[inline]
     fn check_time(&self) -> Result<(), ResourceError> {
         Ok(())
@@ -383,12 +390,24 @@ pub struct LimitedTracker {
     /// Total number of allocations made.
     allocation_count: usize,
     /// Current approximate memory usage in bytes.
+    ///
+    /// Only maintained when `limits.max_memory` is set (it cannot change after
+    /// construction); otherwise size estimation is skipped entirely and this stays 0.
     current_memory: usize,
-    /// Counter for rate-limiting `Instant::elapsed()` calls in `check_time`.
+    /// Number of `check_time` calls left before `Instant::elapsed()` is next consulted.
+    ///
+    /// Counts down rather than up so the per-instruction path is a load, compare and
+    /// store, with no modulo.
     ///
     /// Uses `AtomicU16` for interior mutability since `check_time` takes `&self`
     /// and `LimitedTracker` must be `Sync` (it ends up inside PyO3 pyclass types).
-    check_counter: AtomicU16,
+    ///
+    /// The tracker is only ever driven by the single thread running the VM, so the
+    /// counter is updated with a relaxed load + store rather than `fetch_sub`: this
+    /// compiles to plain moves instead of a locked read-modify-write on every
+    /// instruction. A lost update under (theoretical) concurrent access would only
+    /// shift when the next elapsed check happens, which is harmless.
+    check_countdown: AtomicU16,
 }
 
 impl LimitedTracker {
@@ -403,7 +422,7 @@ impl LimitedTracker {
             start_time: Instant::now(),
             allocation_count: 0,
             current_memory: 0,
-            check_counter: AtomicU16::new(0),
+            check_countdown: AtomicU16::new(TIME_CHECK_INTERVAL),
         }
     }
 
@@ -414,6 +433,8 @@ impl LimitedTracker {
     }
 
     /// Returns the current approximate memory usage.
+    ///
+    /// Always 0 when no memory limit is set, since usage is then not tracked.
     #[must_use]
     pub fn current_memory(&self) -> usize {
         self.current_memory
@@ -448,44 +469,55 @@ impl ResourceTracker for LimitedTracker {
             });
         }
 
-        let size = get_size();
-        // Check memory limit
+        // Check memory limit. Estimating the size walks the value, so memory is only
+        // tracked at all when a memory limit is set.
         if let Some(max) = self.limits.max_memory {
-            let new_memory = self.current_memory + size;
+            let new_memory = self.current_memory + get_size();
             if new_memory > max {
                 return Err(ResourceError::Memory {
                     limit: max,
                     used: new_memory,
                 });
             }
+            self.current_memory = new_memory;
         }
 
-        // Update tracking state
         self.allocation_count += 1;
-        self.current_memory += size;
 
         Ok(())
     }
 
     fn on_free(&mut self, get_size: impl FnOnce() -> usize) {
-        self.current_memory = self.current_memory.saturating_sub(get_size());
+        if self.limits.max_memory.is_some() {
+            self.current_memory = self.current_memory.saturating_sub(get_size());
+        }
+    }
+
+    fn on_reconcile(&mut self, get_live_bytes: impl FnOnce() -> usize) {
+        // Only worth walking the heap when a memory limit is being enforced. Never lower
+        // the total: it also covers non-heap allocations such as namespaces.
+        if self.limits.max_memory.is_some() {
+            self.current_memory = self.current_memory.max(get_live_bytes());
+        }
     }
 
     fn check_time(&self) -> Result<(), ResourceError> {
         if let Some(max) = self.limits.max_duration {
-            let count = self.check_counter.fetch_add(1, Ordering::Relaxed).wrapping_add(1);
-            if count.is_multiple_of(TIME_CHECK_INTERVAL) {
-                // Only call Instant::elapsed() every TIME_CHECK_INTERVAL calls
-                let elapsed = self.start_time.elapsed();
-                if elapsed > max {
-                    // Reset counter so the very next check_time call also triggers
-                    // an elapsed check. This is important because some callers
-                    // (e.g. repr_sequence_fmt) catch the error and return normally,
-                    // and we need the VM loop's next check_time to re-detect timeout.
-                    self.check_counter
-                        .store(TIME_CHECK_INTERVAL.wrapping_sub(1), Ordering::Relaxed);
-                    return Err(ResourceError::Time { limit: max, elapsed });
-                }
+            let remaining = self.check_countdown.load(Ordering::Relaxed);
+            if remaining > 1 {
+                self.check_countdown.store(remaining - 1, Ordering::Relaxed);
+                return Ok(());
+            }
+            self.check_countdown.store(TIME_CHECK_INTERVAL, Ordering::Relaxed);
+
+            let elapsed = self.start_time.elapsed();
+            if elapsed > max {
+                // Zero the countdown so the very next check_time call also checks the
+                // elapsed time. This is important because some callers
+                // (e.g. repr_sequence_fmt) catch the error and return normally,
+                // and we need the VM loop's next check_time to re-detect timeout.
+                self.check_countdown.store(0, Ordering::Relaxed);
+                return Err(ResourceError::Time { limit: max, elapsed });
             }
         }
         Ok(())
@@ -15,6 +15,10 @@ use crate::{
     value::{EitherStr, Value},
 };
 
+/// Largest number of declared fields for which attribute reads scan `field_names`
+/// before falling back to a hashed lookup in the attrs Dict.
+const FIELD_SCAN_LIMIT: usize = 8;
+
 /// Python dataclass instance type.
 ///
 /// Represents an instance of a dataclass with a class name, field values, and
@@ -26,6 +30,7 @@ use crate::{
 /// # Fields
 /// - `name`: The class name (e.g., "Point", "User")
 /// - `field_names`: Declared field names in definition order (used for repr)
+/// - `field_slots`: Expected entry index in `attrs` of each declared field, resolved at construction
 /// - `attrs`: All attributes including declared fields and dynamically added ones
 /// - `frozen`: Whether the dataclass instance is immutable
 ///
@@ -40,7 +45,8 @@ use crate::{
 /// all attribute values when the dataclass instance is freed.
 ///
 /// # Attribute Access
-/// - Getting: Looks up the attribute name in the attrs Dict
+/// - Getting: Declared fields are read through their cached slot in attrs; other
+///   names fall back to a hashed lookup in the attrs Dict
 /// - Setting: Updates or adds the attribute in attrs (only if not frozen)
 /// - Method calls: If the attribute is a public name not found in attrs, dispatched to host
 /// - repr: Only shows declared fields (from field_names), not extra attributes
@@ -52,6 +58,14 @@ pub(crate) struct Dataclass {
     type_id: u64,
     /// Declared field names in definition order (for repr and hashing)
     field_names: Vec<String>,
+    /// Expected entry index in `attrs` of each declared field (parallel to `field_names`),
+    /// or `None` if the field was absent at construction.
+    ///
+    /// Dataclass attrs are only ever replaced in place or appended, never removed,
+    /// so these indices normally stay valid. They are still only hints: each use checks
+    /// the entry's key before reading it. Slots are derived data and not serialized;
+    /// deserialization guesses declaration order.
+    field_slots: Vec<Option<usize>>,
     /// All attributes (both declared fields and dynamically added)
     attrs: Dict,
     /// Whether this dataclass instance is immutable (affects hashability)
@@ -67,12 +81,27 @@ impl Dataclass {
     /// * `field_names` - Declared field names in definition order
     /// * `attrs` - Dict of attribute name -> value pairs (ownership transferred)
     /// * `frozen` - Whether this dataclass instance is immutable (affects hashability)
+    /// * `heap` / `interns` - Used to resolve each declared field's slot in `attrs`
     #[must_use]
-    pub fn new(name: impl Into<EitherStr>, type_id: u64, field_names: Vec<String>, attrs: Dict, frozen: bool) -> Self {
+    pub fn new(
+        name: impl Into<EitherStr>,
+        type_id: u64,
+        field_names: Vec<String>,
+        attrs: Dict,
+        frozen: bool,
+        heap: &Heap<impl ResourceTracker>,
+        interns: &Interns,
+    ) -> Self {
+        let field_slots = field_names
+            .iter()
+            .enumerate()
+            .map(|(pos, field_name)| attrs.index_of_str_hinted(field_name, pos, heap, interns))
+            .collect();
         Self {
             name: name.into(),
             type_id,
             field_names,
+            field_slots,
             attrs,
             frozen,
         }
@@ -117,6 +146,34 @@ impl Dataclass {
         self.frozen
     }
 
+    /// Looks up an attribute value by name.
+    ///
+    /// For dataclasses with at most `FIELD_SCAN_LIMIT` fields, declared fields are found
+    /// by comparing against `field_names` and loading the cached slot, avoiding hashing
+    /// the name. The scan makes misses (non-field attributes) pay up to that many string
+    /// comparisons before the hashed lookup, so larger dataclasses go straight to the
+    /// hashed lookup in the attrs Dict.
+    fn get_attr_by_str(&self, attr_name: &str, heap: &Heap<impl ResourceTracker>, interns: &Interns) -> Option<&Value> {
+        if self.field_names.len() <= FIELD_SCAN_LIMIT
+            && let Some(pos) = self.field_names.iter().position(|field_name| field_name == attr_name)
+        {
+            return self.field_value(pos, heap, interns);
+        }
+        self.attrs.get_by_str(attr_name, heap, interns)
+    }
+
+    /// Returns the value of the declared field at position `pos` in `field_names`.
+    ///
+    /// Reads the cached slot when its key still matches the field name, otherwise
+    /// (the field was added later via `set_attr`, or the slot is stale) looks it up by name.
+    fn field_value(&self, pos: usize, heap: &Heap<impl ResourceTracker>, interns: &Interns) -> Option<&Value> {
+        let field_name = &self.field_names[pos];
+        match self.field_slots.get(pos).copied().flatten() {
+            Some(slot) => self.attrs.get_by_str_hinted(field_name, slot, heap, interns),
+            None => self.attrs.get_by_str(field_name, heap, interns),
+        }
+    }
+
     /// Sets an attribute value.
     ///
     /// The caller transfers ownership of both `name` and `value`. Returns the
@@ -171,9 +228,9 @@ impl Dataclass {
         // Hash the class name
         self.name.hash(&mut hasher);
         // Hash each declared field (name, value) pair in order
-        for field_name in &self.field_names {
+        for (pos, field_name) in self.field_names.iter().enumerate() {
             field_name.hash(&mut hasher);
-            if let Some(value) = self.attrs.get_by_str(field_name, heap, interns) {
+            if let Some(value) = self.field_value(pos, heap, interns) {
                 match value.py_hash(heap, interns)? {
                     Some(h) => h.hash(&mut hasher),
                     None => return Ok(None),
@@ -193,6 +250,7 @@ impl PyTrait for Dataclass {
         std::mem::size_of::<Self>()
             + self.name.py_estimate_size()
             + self.field_names.iter().map(String::len).sum::<usize>()
+            + self.field_slots.len() * std::mem::size_of::<Option<usize>>()
             + self.attrs.py_estimate_size()
     }
 
@@ -240,7 +298,7 @@ impl PyTrait for Dataclass {
         f.write_char('(')?;
 
         let mut first = true;
-        for field_name in &self.field_names {
+        for (pos, field_name) in self.field_names.iter().enumerate() {
             if !first {
                 f.write_str(", ")?;
             }
@@ -251,7 +309,7 @@ impl PyTrait for Dataclass {
             f.write_char('=')?;
 
             // Look up value in attrs
-            if let Some(value) = self.attrs.get_by_str(field_name, heap, interns) {
+            if let Some(value) = self.field_value(pos, heap, interns) {
                 value.py_repr_fmt(f, heap, heap_ids, interns)?;
             } else {
                 // Field not found - shouldn't happen for well-formed dataclasses
@@ -278,7 +336,7 @@ impl PyTrait for Dataclass {
         defer_drop!(args, heap);
 
         // If the attribute exists in attrs, it's a data value (not callable)
-        if let Some(value) = self.attrs.get_by_str(method_name, heap, interns) {
+        if let Some(value) = self.get_attr_by_str(method_name, heap, interns) {
             let type_name = value.py_type(heap);
             Err(ExcType::type_error_not_callable_object(type_name))
         } else {
@@ -301,7 +359,7 @@ impl PyTrait for Dataclass {
     ) -> RunResult<AttrCallResult> {
         let attr_str = attr.as_str(vm.interns);
         // Only public methods (no underscore prefix = no dunders, no private)
-        if !attr_str.starts_with('_') && self.attrs.get_by_str(attr_str, vm.heap, vm.interns).is_none() {
+        if !attr_str.starts_with('_') && self.get_attr_by_str(attr_str, vm.heap, vm.interns).is_none() {
             // Clone self and prepend to args for the method call
             // inc_ref works even when data is taken out (refcount metadata is separate)
             vm.heap.inc_ref(self_id);
@@ -322,7 +380,7 @@ impl PyTrait for Dataclass {
         interns: &Interns,
     ) -> RunResult<Option<AttrCallResult>> {
         let attr_name = attr.as_str(interns);
-        match self.attrs.get_by_str(attr_name, heap, interns) {
+        match self.get_attr_by_str(attr_name, heap, interns) {
             Some(value) => Ok(Some(AttrCallResult::Value(value.clone_with_heap(heap)))),
             // we use name here, not `self.py_type(heap)` hence returning a Ok(None)
             None => Err(ExcType::attribute_error(self.name(interns), attr_name)),
@@ -331,7 +389,7 @@ impl PyTrait for Dataclass {
 }
 
 // Custom serde implementation for Dataclass.
-// Serializes all five fields.
+// Serializes all five stored fields; `field_slots` is derived and rebuilt on load.
 impl serde::Serialize for Dataclass {
     fn serialize<S: serde::Serializer>(&self, serializer: S) -> Result<S::Ok, S::Error> {
         use serde::ser::SerializeStruct;
@@ -356,10 +414,14 @@ impl<'de> serde::Deserialize<'de> for Dataclass {
             frozen: bool,
         }
         let dc = DataclassData::deserialize(deserializer)?;
+        // Keys can't be resolved without the heap, so guess declaration order;
+        // `field_value` verifies each slot's key before using it
+        let field_slots = (0..dc.field_names.len()).map(Some).collect();
         Ok(Self {
             name: dc.name,
             type_id: dc.type_id,
             field_names: dc.field_names,
+            field_slots,
             attrs: dc.attrs,
             frozen: dc.frozen,
         })
@@ -8,7 +8,7 @@ use ahash::AHashSet;
 use hashbrown::{HashTable, hash_table::Entry};
 use smallvec::smallvec;
 
-use super::{List, MontyIter, PyTrait, allocate_tuple};
+use super::{List, LongInt, MontyIter, PyTrait, allocate_tuple};
 use crate::{
     args::{ArgValues, KwargsValues},
     defer_drop, defer_drop_mut,
@@ -17,7 +17,7 @@ use crate::{
     intern::{Interns, StaticStrings},
     resource::{ResourceError, ResourceTracker},
     types::Type,
-    value::{EitherStr, Value},
+    value::{EitherStr, Value, hash_i64},
 };
 
 /// Python dict type preserving insertion order.
@@ -152,6 +152,15 @@ impl Dict {
     /// This is an O(1) lookup that doesn't require mutable heap access.
     /// Only works for string keys - returns None if the key is not found.
     pub fn get_by_str(&self, key_str: &str, heap: &Heap<impl ResourceTracker>, interns: &Interns) -> Option<&Value> {
+        self.index_of_str(key_str, heap, interns)
+            .map(|idx| &self.entries[idx].value)
+    }
+
+    /// Returns the entry index of a string key, or None if the key is not found.
+    ///
+    /// Like `get_by_str`, but returns the position in insertion order so callers
+    /// can cache it and pass it back as a hint to `get_by_str_hinted`.
+    pub fn index_of_str(&self, key_str: &str, heap: &Heap<impl ResourceTracker>, interns: &Interns) -> Option<usize> {
         // Compute hash for the string key
         let mut hasher = DefaultHasher::new();
         key_str.hash(&mut hasher);
@@ -159,21 +168,40 @@ impl Dict {
 
         // Find entry with matching hash and key
         self.indices
-            .find(hash, |&idx| {
-                let entry_key = &self.entries[idx].key;
-                match entry_key {
-                    Value::InternString(id) => interns.get_str(*id) == key_str,
-                    Value::Ref(id) => {
-                        if let HeapData::Str(s) = heap.get(*id) {
-                            s.as_str() == key_str
-                        } else {
-                            false
-                        }
-                    }
-                    _ => false,
-                }
-            })
-            .map(|&idx| &self.entries[idx].value)
+            .find(hash, |&idx| key_is_str(&self.entries[idx].key, key_str, heap, interns))
+            .copied()
+    }
+
+    /// Like `index_of_str`, but first checks whether the entry at `hint` holds the key.
+    ///
+    /// Callers that expect keys in a known order (e.g. dataclass fields, which hosts
+    /// send in declaration order) skip hashing entirely when the guess is right.
+    pub fn index_of_str_hinted(
+        &self,
+        key_str: &str,
+        hint: usize,
+        heap: &Heap<impl ResourceTracker>,
+        interns: &Interns,
+    ) -> Option<usize> {
+        match self.entries.get(hint) {
+            Some(entry) if key_is_str(&entry.key, key_str, heap, interns) => Some(hint),
+            _ => self.index_of_str(key_str, heap, interns),
+        }
+    }
+
+    /// Like `get_by_str`, but first checks whether the entry at `hint` holds the key.
+    ///
+    /// The hint is verified before use, so a stale or out-of-range hint only costs
+    /// the fallback hashed lookup.
+    pub fn get_by_str_hinted(
+        &self,
+        key_str: &str,
+        hint: usize,
+        heap: &Heap<impl ResourceTracker>,
+        interns: &Interns,
+    ) -> Option<&Value> {
+        self.index_of_str_hinted(key_str, hint, heap, interns)
+            .map(|idx| &self.entries[idx].value)
     }
 
     /// Sets a key-value pair in the dict.
@@ -240,13 +268,11 @@ impl Dict {
         heap: &mut Heap<impl ResourceTracker>,
         interns: &Interns,
     ) -> RunResult<Option<(Value, Value)>> {
-        let hash = key
-            .py_hash(heap, interns)?
-            .ok_or_else(|| ExcType::type_error_unhashable_dict_key(key.py_type(heap)))?;
+        let hash = key_hash(key, heap, interns)?;
 
         let entry = self.indices.entry(
             hash,
-            |v| key.py_eq(&self.entries[*v].key, heap, interns).unwrap_or(false),
+            |v| key_matches(key, &self.entries[*v].key, heap, interns),
             |index| self.entries[*index].hash,
         );
 
@@ -365,18 +391,10 @@ impl Dict {
         heap: &mut Heap<impl ResourceTracker>,
         interns: &Interns,
     ) -> RunResult<(Option<usize>, u64)> {
-        let hash = key
-            .py_hash(heap, interns)?
-            .ok_or_else(|| ExcType::type_error_unhashable_dict_key(key.py_type(heap)))?;
-
-        // Dict keys are typically shallow (strings, ints, tuples of primitives),
-        // so recursion errors are unlikely. If one occurs, treat it as "not equal" -
-        // the key lookup fails but doesn't crash.
+        let hash = key_hash(key, heap, interns)?;
         let opt_index = self
             .indices
-            .find(hash, |v| {
-                key.py_eq(&self.entries[*v].key, heap, interns).unwrap_or(false)
-            })
+            .find(hash, |v| key_matches(key, &self.entries[*v].key, heap, interns))
             .copied();
         Ok((opt_index, hash))
     }
@@ -915,6 +933,72 @@ impl<'de> serde::Deserialize<'de> for Dict {
     }
 }
 
+/// Computes the hash of a dict key, raising `TypeError` if it is unhashable.
+///
+/// Int keys are hashed directly rather than through the generic `py_hash` dispatch.
+#[inline]
+fn key_hash(key: &Value, heap: &mut Heap<impl ResourceTracker>, interns: &Interns) -> RunResult<u64> {
+    if let Value::Int(i) = key {
+        return Ok(hash_i64(*i));
+    }
+    key.py_hash(heap, interns)?
+        .ok_or_else(|| ExcType::type_error_unhashable_dict_key(key.py_type(heap)))
+}
+
+/// Returns whether the lookup `key` equals the stored `entry_key`.
+///
+/// Int and LongInt lookups, the common case for int-keyed dicts (including ones mixing
+/// i64 and bigint keys), compare the stored key directly instead of going through the
+/// generic `py_eq` dispatch.
+///
+/// Dict keys are typically shallow (strings, ints, tuples of primitives),
+/// so recursion errors are unlikely. If one occurs, treat it as "not equal" -
+/// the key lookup fails but doesn't crash.
+#[inline]
+fn key_matches(key: &Value, entry_key: &Value, heap: &mut Heap<impl ResourceTracker>, interns: &Interns) -> bool {
+    match key {
+        Value::Int(i) => key_is_int(entry_key, *i, heap),
+        Value::Ref(id) => match heap.get(*id) {
+            HeapData::LongInt(li) => key_is_long_int(entry_key, li, heap),
+            _ => key.py_eq(entry_key, heap, interns).unwrap_or(false),
+        },
+        _ => key.py_eq(entry_key, heap, interns).unwrap_or(false),
+    }
+}
+
+/// Returns whether a dict key is numerically equal to the LongInt `li`.
+///
+/// Heap LongInts are normally outside the i64 range, so an `Int` key only matches a
+/// non-normalized one; two LongInts compare sign and digits directly.
+fn key_is_long_int(key: &Value, li: &LongInt, heap: &Heap<impl ResourceTracker>) -> bool {
+    match key {
+        Value::Int(i) => li.cmp_i64(*i).is_eq(),
+        Value::Ref(id) => matches!(heap.get(*id), HeapData::LongInt(other) if other == li),
+        _ => false,
+    }
+}
+
+/// Returns whether a dict key is numerically equal to the int `i`.
+///
+/// Only `Int` and `LongInt` keys can match: `Bool` and `Float` keys hash differently
+/// from ints, so they would only be compared here on an incidental hash collision.
+fn key_is_int(key: &Value, i: i64, heap: &Heap<impl ResourceTracker>) -> bool {
+    match key {
+        Value::Int(k) => *k == i,
+        Value::Ref(id) => matches!(heap.get(*id), HeapData::LongInt(li) if li.cmp_i64(i).is_eq()),
+        _ => false,
+    }
+}
+
+/// Returns whether a dict key is a string equal to `key_str`.
+fn key_is_str(key: &Value, key_str: &str, heap: &Heap<impl ResourceTracker>, interns: &Interns) -> bool {
+    match key {
+        Value::InternString(id) => interns.get_str(*id) == key_str,
+        Value::Ref(id) => matches!(heap.get(*id), HeapData::Str(s) if s.as_str() == key_str),
+        _ => false,
+    }
+}
+
 /// Implements Python's `dict.fromkeys(iterable[, value])` classmethod.
 ///
 /// Creates a new dictionary with keys from `iterable` and all values set to `value`
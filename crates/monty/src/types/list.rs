@@ -15,7 +15,7 @@ use crate::{
     resource::{ResourceError, ResourceTracker},
     sorting::{apply_permutation, sort_indices},
     types::Type,
-    value::{EitherStr, Value},
+    value::{EitherStr, Value, sequence_items_eq},
 };
 
 /// Python list type, wrapping a Vec of Values.
@@ -307,19 +307,7 @@ impl PyTrait for List {
         heap: &mut Heap<impl ResourceTracker>,
         interns: &Interns,
     ) -> Result<bool, ResourceError> {
-        if self.items.len() != other.items.len() {
-            return Ok(false);
-        }
-        let token = heap.incr_recursion_depth()?;
-        defer_drop!(token, heap);
-
-        for (i1, i2) in self.items.iter().zip(&other.items) {
-            heap.check_time()?;
-            if !i1.py_eq(i2, heap, interns)? {
-                return Ok(false);
-            }
-        }
-        Ok(true)
+        sequence_items_eq(&self.items, &other.items, heap, interns)
     }
 
     fn py_dec_ref_ids(&mut self, stack: &mut Vec<HeapId>) {
@@ -9,6 +9,7 @@
 //! having freestanding functions scattered across the codebase.
 
 use std::{
+    cmp::Ordering,
     collections::hash_map::DefaultHasher,
     fmt::{self, Display},
     hash::{Hash, Hasher},
@@ -21,7 +22,7 @@ use num_traits::{Signed, ToPrimitive, Zero};
 use crate::{
     heap::{Heap, HeapData},
     resource::{ResourceError, ResourceTracker},
-    value::Value,
+    value::{Value, hash_i64},
 };
 
 /// Wrapper around `num_bigint::BigInt` for arbitrary precision integers.
@@ -57,30 +58,85 @@ impl LongInt {
         }
     }
 
+    /// Converts an `i128` arithmetic result to a `Value`, demoting to i64 if it fits.
+    ///
+    /// Counterpart to `to_i128` for the native fast paths: only results outside the
+    /// i64 range build a `BigInt` and allocate on the heap.
+    pub fn i128_into_value(value: i128, heap: &mut Heap<impl ResourceTracker>) -> Result<Value, ResourceError> {
+        if let Ok(i) = i64::try_from(value) {
+            Ok(Value::Int(i))
+        } else {
+            let heap_id = heap.allocate(HeapData::LongInt(Self::new(BigInt::from(value))))?;
+            Ok(Value::Ref(heap_id))
+        }
+    }
+
+    /// Returns the value as an `i128` if it fits.
+    ///
+    /// Heap `LongInt`s are outside the i64 range, but values just past it (e.g. `2**63`)
+    /// still fit in 128 bits. Adding or subtracting those natively avoids building a
+    /// temporary `BigInt` for results that fall straight back into i64 range.
+    pub fn to_i128(&self) -> Option<i128> {
+        self.0.to_i128()
+    }
+
+    /// Compares this value with an `i64` without building a `BigInt` for the `i64`.
+    pub fn cmp_i64(&self, other: i64) -> Ordering {
+        match self.0.to_i64() {
+            Some(v) => v.cmp(&other),
+            // Outside the i64 range, so the sign alone decides
+            None if self.0.is_negative() => Ordering::Less,
+            None => Ordering::Greater,
+        }
+    }
+
+    /// Returns the lowest 64 bits of the value's two's complement representation.
+    ///
+    /// Python's bitwise operators treat negative ints as infinitely sign-extended two's
+    /// complement, so a negative value's low bits are those of its magnitude negated.
+    pub fn low_i64_bits(&self) -> i64 {
+        let low = self.0.iter_u64_digits().next().unwrap_or(0);
+        let low = if self.0.is_negative() { low.wrapping_neg() } else { low };
+        low.cast_signed()
+    }
+
     /// Computes a hash consistent with i64 hashing.
     ///
     /// Critical: For values that fit in i64, this must return the same hash as
     /// hashing the i64 directly. This ensures dict key consistency - e.g.,
     /// `hash(5)` must equal `hash(LongInt(5))`.
     pub fn hash(&self) -> u64 {
-        // If the LongInt fits in i64, hash as i64 for consistency
-        if let Some(i) = self.0.to_i64() {
-            let mut hasher = DefaultHasher::new();
-            // Hash the i64 discriminant and value to match Value::Int hashing
-            std::mem::discriminant(&Value::Int(0)).hash(&mut hasher);
-            i.hash(&mut hasher);
-            hasher.finish()
+        Self::hash_bigint(&self.0)
+    }
+
+    /// Computes the hash of a `BigInt`, shared by heap `LongInt`s and interned literals.
+    ///
+    /// Heap `LongInt`s cache the result in their heap entry, but interned literals are
+    /// hashed on every use, so this reads the digits in place rather than
+    /// serializing them into a temporary byte vector first.
+    pub fn hash_bigint(bi: &BigInt) -> u64 {
+        // If the value fits in i64, hash as i64 for consistency
+        if let Some(i) = bi.to_i64() {
+            hash_i64(i)
         } else {
-            // For LongInts outside i64 range, use byte representation
+            // For values outside i64 range, hash the sign and the (normalized) digits
             let mut hasher = DefaultHasher::new();
-            // Use a unique discriminant for LongInt (we use the LongInt's sign and bytes)
-            let (sign, bytes) = self.0.to_bytes_le();
-            sign.hash(&mut hasher);
-            bytes.hash(&mut hasher);
+            bi.sign().hash(&mut hasher);
+            for digit in bi.iter_u64_digits() {
+                digit.hash(&mut hasher);
+            }
             hasher.finish()
         }
     }
 
+    /// Formats the value as a decimal string, as `str()` does.
+    ///
+    /// `to_string()` goes through `Display`, and `BigInt`'s `Display` renders into its own
+    /// `String` before copying it into the output. This returns that rendering directly.
+    pub fn to_decimal_string(&self) -> String {
+        self.0.to_str_radix(10)
+    }
+
     /// Estimates memory size in bytes.
     ///
     /// Used for resource tracking. The actual size includes the Vec overhead
@@ -1013,23 +1013,11 @@ impl FrozenSet {
     /// Computes the hash of this frozenset.
     ///
     /// The hash is the XOR of all element hashes, making it order-independent.
-    /// Checks recursion depth before recursing into element hashes.
-    pub fn compute_hash(
-        &self,
-        heap: &mut Heap<impl ResourceTracker>,
-        interns: &Interns,
-    ) -> Result<Option<u64>, ResourceError> {
-        let token = heap.incr_recursion_depth()?;
-        defer_drop!(token, heap);
-        let mut hash: u64 = 0;
-        for entry in &self.0.entries {
-            // All elements must be hashable (enforced at construction)
-            match entry.value.py_hash(heap, interns)? {
-                Some(h) => hash ^= h,
-                None => return Ok(None),
-            }
-        }
-        Ok(Some(hash))
+    /// Every element was hashed on insertion and its hash is stored alongside it, so
+    /// no element is visited again and nesting depth does not matter.
+    #[must_use]
+    pub fn compute_hash(&self) -> u64 {
+        self.0.entries.iter().fold(0, |hash, entry| hash ^ entry.hash)
     }
 
     /// Creates a frozenset from a Set, consuming the Set's storage.
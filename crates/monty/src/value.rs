@@ -12,16 +12,18 @@ use ahash::AHashSet;
 use num_bigint::BigInt;
 use num_integer::Integer;
 use num_traits::{ToPrimitive, Zero};
+use smallvec::SmallVec;
 
 use crate::{
     asyncio::CallId,
     builtins::Builtins,
+    defer_drop, defer_drop_mut,
     exception_private::{ExcType, RunError, RunResult, SimpleException},
-    heap::{Heap, HeapData, HeapId},
+    heap::{DropWithHeap, Heap, HeapData, HeapId, RecursionToken},
     heap_data::HeapDataMut,
     intern::{BytesId, ExtFunctionId, FunctionId, Interns, LongIntId, StaticStrings, StringId},
     modules::ModuleFunctions,
-    resource::{ResourceError, ResourceTracker, check_div_size, check_lshift_size, check_pow_size, check_repeat_size},
+    resource::{ResourceError, ResourceTracker, check_lshift_size, check_pow_size, check_repeat_size},
     types::{
         AttrCallResult, LongInt, Property, PyTrait, Str, Type,
         bytes::{bytes_repr_fmt, get_byte_at_index, get_bytes_slice},
@@ -178,7 +180,7 @@ impl PyTrait for Value {
             // Int == LongInt comparison
             (Self::Int(a), Self::Ref(id)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
-                    Ok(BigInt::from(*a) == *li.inner())
+                    Ok(li.cmp_i64(*a).is_eq())
                 } else {
                     Ok(false)
                 }
@@ -186,7 +188,7 @@ impl PyTrait for Value {
             // LongInt == Int comparison
             (Self::Ref(id), Self::Int(b)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
-                    Ok(*li.inner() == BigInt::from(*b))
+                    Ok(li.cmp_i64(*b).is_eq())
                 } else {
                     Ok(false)
                 }
@@ -235,6 +237,9 @@ impl PyTrait for Value {
                 if *id1 == *id2 {
                     return Ok(true);
                 }
+                if let Some(result) = heap_sequence_eq(*id1, *id2, heap, interns)? {
+                    return Ok(result);
+                }
                 // Need to use with_two for proper borrow management
                 heap.with_two(*id1, *id2, |heap, left, right| left.py_eq(right, heap, interns))
             }
@@ -273,7 +278,7 @@ impl PyTrait for Value {
             // Int vs LongInt comparison
             (Self::Int(a), Self::Ref(id)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
-                    Ok(BigInt::from(*a).partial_cmp(li.inner()))
+                    Ok(Some(li.cmp_i64(*a).reverse()))
                 } else {
                     Ok(None)
                 }
@@ -281,7 +286,7 @@ impl PyTrait for Value {
             // LongInt vs Int comparison
             (Self::Ref(id), Self::Int(b)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
-                    Ok(li.inner().partial_cmp(&BigInt::from(*b)))
+                    Ok(Some(li.cmp_i64(*b)))
                 } else {
                     Ok(None)
                 }
@@ -426,14 +431,16 @@ impl PyTrait for Value {
                 if let Some(result) = a.checked_add(*b) {
                     Ok(Some(Self::Int(result)))
                 } else {
-                    // Overflow - promote to LongInt
-                    let li = LongInt::from(*a) + LongInt::from(*b);
-                    li.into_value(heap).map(Some)
+                    // Overflow - promote to LongInt (the i128 sum cannot overflow)
+                    LongInt::i128_into_value(i128::from(*a) + i128::from(*b), heap).map(Some)
                 }
             }
             // Int + LongInt
             (Self::Int(i), Self::Ref(id)) | (Self::Ref(id), Self::Int(i)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
+                    if let Some(sum) = li.to_i128().and_then(|x| x.checked_add(i128::from(*i))) {
+                        return LongInt::i128_into_value(sum, heap).map(Some);
+                    }
                     let result = LongInt::new(li.inner() + i);
                     result.into_value(heap).map(Some)
                 } else {
@@ -514,15 +521,17 @@ impl PyTrait for Value {
                 if let Some(result) = a.checked_sub(*b) {
                     Ok(Some(Self::Int(result)))
                 } else {
-                    // Overflow - promote to LongInt
-                    let li = LongInt::from(*a) - LongInt::from(*b);
-                    li.into_value(heap).map(Some)
+                    // Overflow - promote to LongInt (the i128 difference cannot overflow)
+                    LongInt::i128_into_value(i128::from(*a) - i128::from(*b), heap).map(Some)
                 }
             }
             // Int - LongInt
             (Self::Int(a), Self::Ref(id)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
-                    let result = LongInt::from(*a) - LongInt::new(li.inner().clone());
+                    if let Some(diff) = li.to_i128().and_then(|x| i128::from(*a).checked_sub(x)) {
+                        return LongInt::i128_into_value(diff, heap).map(Some);
+                    }
+                    let result = LongInt::new(a - li.inner());
                     result.into_value(heap).map(Some)
                 } else {
                     Ok(None)
@@ -531,7 +540,10 @@ impl PyTrait for Value {
             // LongInt - Int
             (Self::Ref(id), Self::Int(b)) => {
                 if let HeapData::LongInt(li) = heap.get(*id) {
-                    let result = LongInt::new(li.inner().clone()) - LongInt::from(*b);
+                    if let Some(diff) = li.to_i128().and_then(|x| x.checked_sub(i128::from(*b))) {
+                        return LongInt::i128_into_value(diff, heap).map(Some);
+                    }
+                    let result = LongInt::new(li.inner() - b);
                     result.into_value(heap).map(Some)
                 } else {
                     Ok(None)
@@ -553,27 +565,25 @@ impl PyTrait for Value {
             (Self::Int(a), Self::Int(b)) => {
                 if *b == 0 {
                     Err(ExcType::zero_division().into())
-                } else if let Some(r) = a.checked_rem(*b) {
-                    // Python modulo: result has the same sign as divisor (b)
-                    let result = if r != 0 && (*a < 0) != (*b < 0) { r + *b } else { r };
-                    Ok(Some(Self::Int(result)))
                 } else {
-                    // Overflow - i64::MIN % -1 is 0
-                    Ok(Some(Self::Int(0)))
+                    Ok(Some(Self::Int(floor_mod(*a, *b))))
                 }
             }
             // Int % LongInt
             (Self::Int(a), Self::Ref(id)) => {
-                // Clone to avoid borrow conflict with heap mutation
-                let b_clone = if let HeapData::LongInt(li) = heap.get(*id) {
+                // Compute from the borrowed operand - the owned result ends the borrow
+                // before heap mutation, so the LongInt never needs copying
+                let bi = if let HeapData::LongInt(li) = heap.get(*id) {
                     if li.is_zero() {
                         return Err(ExcType::zero_division().into());
                     }
-                    li.inner().clone()
+                    if let Some((_, rem)) = li.to_i128().and_then(|d| floor_divmod_i128(i128::from(*a), d)) {
+                        return Ok(Some(LongInt::i128_into_value(rem, heap)?));
+                    }
+                    BigInt::from(*a).mod_floor(li.inner())
                 } else {
                     return Ok(None);
                 };
-                let bi = BigInt::from(*a).mod_floor(&b_clone);
                 Ok(Some(LongInt::new(bi).into_value(heap)?))
             }
             // LongInt % Int
@@ -581,13 +591,15 @@ impl PyTrait for Value {
                 if *b == 0 {
                     return Err(ExcType::zero_division().into());
                 }
-                // Clone to avoid borrow conflict with heap mutation
-                let a_clone = if let HeapData::LongInt(li) = heap.get(*id) {
-                    li.inner().clone()
+                // Compute from the borrowed operand, as above
+                let bi = if let HeapData::LongInt(li) = heap.get(*id) {
+                    if let Some((_, rem)) = li.to_i128().and_then(|n| floor_divmod_i128(n, i128::from(*b))) {
+                        return Ok(Some(LongInt::i128_into_value(rem, heap)?));
+                    }
+                    li.inner().mod_floor(&BigInt::from(*b))
                 } else {
                     return Ok(None);
                 };
-                let bi = a_clone.mod_floor(&BigInt::from(*b));
                 Ok(Some(LongInt::new(bi).into_value(heap)?))
             }
             // LongInt % LongInt
@@ -619,16 +631,7 @@ impl PyTrait for Value {
 
     fn py_mod_eq(&self, other: &Self, right_value: i64) -> Option<bool> {
         match (self, other) {
-            (Self::Int(v1), Self::Int(v2)) => {
-                if let Some(r) = v1.checked_rem(*v2) {
-                    // Python modulo: result has same sign as divisor
-                    let result = if r != 0 && (*v1 < 0) != (*v2 < 0) { r + *v2 } else { r };
-                    Some(result == right_value)
-                } else {
-                    // checked_rem returns None for overflow (i64::MIN % -1) or zero division
-                    (*v2 != 0).then_some(0 == right_value)
-                }
-            }
+            (Self::Int(v1), Self::Int(v2)) => (*v2 != 0).then(|| floor_mod(*v1, *v2) == right_value),
             (Self::Float(v1), Self::Float(v2)) => Some(v1 % v2 == right_value as f64),
             (Self::Float(v1), Self::Int(v2)) => Some(v1 % (*v2 as f64) == right_value as f64),
             (Self::Int(v1), Self::Float(v2)) => Some((*v1 as f64) % v2 == right_value as f64),
@@ -648,9 +651,8 @@ impl PyTrait for Value {
                 if let Some(result) = v1.checked_add(*v2) {
                     *self = Self::Int(result);
                 } else {
-                    // Overflow - promote to LongInt
-                    let li = LongInt::from(*v1) + LongInt::from(*v2);
-                    *self = li.into_value(heap)?;
+                    // Overflow - promote to LongInt (the i128 sum cannot overflow)
+                    *self = LongInt::i128_into_value(i128::from(*v1) + i128::from(*v2), heap)?;
                 }
                 Ok(true)
             }
@@ -739,9 +741,8 @@ impl PyTrait for Value {
                 if let Some(result) = a.checked_mul(*b) {
                     Ok(Some(Self::Int(result)))
                 } else {
-                    // Overflow - promote to LongInt
-                    let li = LongInt::from(*a) * LongInt::from(*b);
-                    Ok(Some(li.into_value(heap)?))
+                    // Overflow - promote to LongInt (the i128 product cannot overflow)
+                    Ok(Some(LongInt::i128_into_value(i128::from(*a) * i128::from(*b), heap)?))
                 }
             }
             // Int * Ref (LongInt or sequence)
@@ -986,10 +987,8 @@ impl PyTrait for Value {
                 } else if let Some((d, _)) = floor_divmod(*a, *b) {
                     Ok(Some(Self::Int(d)))
                 } else {
-                    // Overflow - promote to LongInt
-                    check_div_size(i64_bits(*a), heap.tracker())?;
-                    let bi = BigInt::from(*a).div_floor(&BigInt::from(*b));
-                    Ok(Some(LongInt::new(bi).into_value(heap)?))
+                    // Only i64::MIN // -1 overflows, and its quotient fits in i128
+                    Ok(Some(LongInt::i128_into_value(-i128::from(*a), heap)?))
                 }
             }
             // Int // LongInt
@@ -997,6 +996,8 @@ impl PyTrait for Value {
                 if let HeapData::LongInt(li) = heap.get(*id) {
                     if li.is_zero() {
                         Err(ExcType::zero_division().into())
+                    } else if let Some((quot, _)) = li.to_i128().and_then(|d| floor_divmod_i128(i128::from(*a), d)) {
+                        Ok(Some(LongInt::i128_into_value(quot, heap)?))
                     } else {
                         let bi = BigInt::from(*a).div_floor(li.inner());
                         Ok(Some(LongInt::new(bi).into_value(heap)?))
@@ -1010,6 +1011,8 @@ impl PyTrait for Value {
                 if let HeapData::LongInt(li) = heap.get(*id) {
                     if *b == 0 {
                         Err(ExcType::zero_division().into())
+                    } else if let Some((quot, _)) = li.to_i128().and_then(|n| floor_divmod_i128(n, i128::from(*b))) {
+                        Ok(Some(LongInt::i128_into_value(quot, heap)?))
                     } else {
                         let bi = li.inner().div_floor(&BigInt::from(*b));
                         Ok(Some(LongInt::new(bi).into_value(heap)?))
@@ -1023,6 +1026,12 @@ impl PyTrait for Value {
                 (HeapData::LongInt(li1), HeapData::LongInt(li2)) => {
                     if li2.is_zero() {
                         Err(ExcType::zero_division().into())
+                    } else if let Some((quot, _)) = li1
+                        .to_i128()
+                        .zip(li2.to_i128())
+                        .and_then(|(n, d)| floor_divmod_i128(n, d))
+                    {
+                        Ok(Some(LongInt::i128_into_value(quot, heap)?))
                     } else {
                         let bi = li1.inner().div_floor(li2.inner());
                         Ok(Some(LongInt::new(bi).into_value(heap)?))
@@ -1104,9 +1113,14 @@ impl PyTrait for Value {
                     Err(ExcType::zero_negative_power())
                 } else if *exp >= 0 {
                     // Positive exponent: try to return int, promote to LongInt on overflow
-                    if let Ok(exp_u32) = u32::try_from(*exp) {
+                    if let Some(result) = unit_base_pow(*base, *exp == 0, exp & 1 == 1) {
+                        Ok(Some(Self::Int(result)))
+                    } else if let Ok(exp_u32) = u32::try_from(*exp) {
                         if let Some(result) = base.checked_pow(exp_u32) {
                             Ok(Some(Self::Int(result)))
+                        } else if let Some(result) = i128::from(*base).checked_pow(exp_u32) {
+                            // Just past i64 (e.g. `2**100`, `10**20`) - square in i128 rather than BigInt
+                            Ok(Some(LongInt::i128_into_value(result, heap)?))
                         } else {
                             // Overflow - promote to LongInt
                             // Check size before computing to prevent DoS
@@ -1180,17 +1194,8 @@ impl PyTrait for Value {
                         Err(ExcType::zero_negative_power())
                     } else if !li.is_negative() {
                         // For very large exponents, most results are huge or 0/1
-                        // Check for x ** 0 = 1 first (including 0 ** 0 = 1)
-                        if li.is_zero() {
-                            Ok(Some(Self::Int(1)))
-                        } else if *base == 0 {
-                            Ok(Some(Self::Int(0)))
-                        } else if *base == 1 {
-                            Ok(Some(Self::Int(1)))
-                        } else if *base == -1 {
-                            // (-1) ** n = 1 if n is even, -1 if n is odd
-                            let is_even = (li.inner() % 2i32).is_zero();
-                            Ok(Some(Self::Int(if is_even { 1 } else { -1 })))
+                        if let Some(result) = unit_base_pow(*base, li.is_zero(), li.inner().is_odd()) {
+                            Ok(Some(Self::Int(result)))
                         } else if let Some(exp_u32) = li.to_u32() {
                             // Reasonable exponent size
                             if let Some(result) = base.checked_pow(exp_u32) {
@@ -1250,14 +1255,8 @@ impl PyTrait for Value {
                     Err(ExcType::zero_negative_power())
                 } else if *exp >= 0 {
                     // Positive exponent: 1**n=1, 0**n=0 (for n>0), 0**0=1
-                    if let Ok(exp_u32) = u32::try_from(*exp) {
-                        match base_int.checked_pow(exp_u32) {
-                            Some(result) => Ok(Some(Self::Int(result))),
-                            None => Ok(Some(Self::Float((base_int as f64).powf(*exp as f64)))),
-                        }
-                    } else {
-                        Ok(Some(Self::Float((base_int as f64).powf(*exp as f64))))
-                    }
+                    let result = unit_base_pow(base_int, *exp == 0, exp & 1 == 1).expect("bool base is 0 or 1");
+                    Ok(Some(Self::Int(result)))
                 } else {
                     // Negative exponent: return float (1**-n=1.0)
                     if let Ok(exp_i32) = i32::try_from(*exp) {
@@ -1497,17 +1496,14 @@ impl Value {
                 interns.get_bytes(*bytes_id).hash(&mut hasher);
                 return Ok(Some(hasher.finish()));
             }
-            // Hash BigInt consistently with LongInt (using sign and bytes for large values)
+            // Hash BigInt consistently with heap LongInts
             Self::InternLongInt(long_int_id) => {
-                let bi = interns.get_long_int(*long_int_id);
-                let mut hasher = DefaultHasher::new();
-                let (sign, bytes) = bi.to_bytes_le();
-                sign.hash(&mut hasher);
-                bytes.hash(&mut hasher);
-                return Ok(Some(hasher.finish()));
+                return Ok(Some(LongInt::hash_bigint(interns.get_long_int(*long_int_id))));
             }
             // For heap-allocated values (includes Range and Exception), compute hash lazily and cache it
             Self::Ref(id) => return heap.get_or_compute_hash(*id, interns),
+            // Ints are the most common dict/set keys, so skip SipHash for them entirely
+            Self::Int(i) => return Ok(Some(hash_i64(*i))),
             _ => {}
         }
 
@@ -1518,7 +1514,6 @@ impl Value {
             // Immediate values can be hashed directly
             Self::Undefined | Self::Ellipsis | Self::None => {}
             Self::Bool(b) => b.hash(&mut hasher),
-            Self::Int(i) => i.hash(&mut hasher),
             // Hash the bit representation of float for consistency
             Self::Float(f) => f.to_bits().hash(&mut hasher),
             Self::Builtin(b) => b.hash(&mut hasher),
@@ -1532,7 +1527,7 @@ impl Value {
             Self::Property(p) => p.hash(&mut hasher),
             // ExternalFutures are hashable based on their call ID
             Self::ExternalFuture(call_id) => call_id.raw().hash(&mut hasher),
-            Self::InternString(_) | Self::InternBytes(_) | Self::InternLongInt(_) | Self::Ref(_) => {
+            Self::Int(_) | Self::InternString(_) | Self::InternBytes(_) | Self::InternLongInt(_) | Self::Ref(_) => {
                 unreachable!("covered above")
             }
             #[cfg(feature = "ref-count-panic")]
@@ -1783,19 +1778,38 @@ impl Value {
         op: BitwiseOp,
         heap: &mut Heap<impl ResourceTracker>,
     ) -> Result<Self, RunError> {
-        // Capture types for error messages
-        let lhs_type = self.py_type(heap);
-        let rhs_type = other.py_type(heap);
-
-        // Extract BigInt from all numeric types
-        let lhs_bigint = extract_bigint(self, heap);
-        let rhs_bigint = extract_bigint(other, heap);
-
-        if let (Some(l), Some(r)) = (lhs_bigint, rhs_bigint) {
-            let result = match op {
-                BitwiseOp::And => l & r,
-                BitwiseOp::Or => l | r,
-                BitwiseOp::Xor => l ^ r,
+        // Fast path: both operands fit in i64, so no BigInt is needed unless a left
+        // shift overflows
+        if let (Some(l), Some(r)) = (small_int(self), small_int(other))
+            && let Some(result) = i64_bitwise(l, r, op)?
+        {
+            return Ok(Self::Int(result));
+        }
+
+        // `big & mask` with a small non-negative mask only reads the LongInt's low bits
+        if matches!(op, BitwiseOp::And)
+            && let Some(result) = long_int_and_mask(self, other, heap).or_else(|| long_int_and_mask(other, self, heap))
+        {
+            return Ok(Self::Int(result));
+        }
+
+        // Borrow LongInt operands straight from the heap: the limb loops run over the
+        // stored digits, and only the result is allocated. Scoped so the borrows end
+        // before the result is moved onto the heap.
+        let result = {
+            let (Some(l), Some(r)) = (extract_bigint(self, heap), extract_bigint(other, heap)) else {
+                return Err(ExcType::binary_type_error(
+                    op.as_str(),
+                    self.py_type(heap),
+                    other.py_type(heap),
+                ));
+            };
+            match op {
+                BitwiseOp::And => &*l & &*r,
+                BitwiseOp::Or => &*l | &*r,
+                // x ^ x is 0 - skip building a zeroed digit vector just to demote it
+                BitwiseOp::Xor if l == r => BigInt::zero(),
+                BitwiseOp::Xor => &*l ^ &*r,
                 BitwiseOp::LShift => {
                     // Get shift amount as i64 for validation
                     let shift_amount = r.to_i64();
@@ -1809,9 +1823,12 @@ impl Value {
                         let shift_u64 = shift as u64;
                         // Check size before computing to prevent DoS
                         check_lshift_size(l.bits(), shift_u64, heap.tracker())?;
-                        l << shift_u64
+                        &*l << shift_u64
                     } else if r.sign() == num_bigint::Sign::Minus {
                         return Err(ExcType::value_error_negative_shift_count());
+                    } else if l.is_zero() {
+                        // 0 << n is 0 however large n is
+                        BigInt::zero()
                     } else {
                         // Shift amount too large to fit in i64 - this would be astronomically large
                         return Err(ExcType::overflow_shift_count());
@@ -1827,7 +1844,7 @@ impl Value {
                         // Safety: shift >= 0 is guaranteed by the check above
                         #[expect(clippy::cast_sign_loss)]
                         let shift_u64 = shift as u64;
-                        l >> shift_u64
+                        &*l >> shift_u64
                     } else if r.sign() == num_bigint::Sign::Minus {
                         return Err(ExcType::value_error_negative_shift_count());
                     } else {
@@ -1839,12 +1856,10 @@ impl Value {
                         }
                     }
                 }
-            };
-            // Convert result back to Value, demoting to i64 if it fits
-            LongInt::new(result).into_value(heap).map_err(Into::into)
-        } else {
-            Err(ExcType::binary_type_error(op.as_str(), lhs_type, rhs_type))
-        }
+            }
+        };
+        // Convert result back to Value, demoting to i64 if it fits
+        LongInt::new(result).into_value(heap).map_err(Into::into)
     }
 
     /// Clones an value with proper heap reference counting.
@@ -2192,13 +2207,60 @@ const fn singleton_id(slot: SingletonSlot) -> usize {
 /// Returns `None` on overflow (i64::MIN / -1 doesn't fit in i64).
 pub(crate) fn floor_divmod(a: i64, b: i64) -> Option<(i64, i64)> {
     let quot = a.checked_div(b)?;
-    let rem = a.checked_rem(b)?;
+    // Can't overflow or divide by zero: checked_div already rejected both cases
+    let rem = a % b;
+    let mask = floor_adjust_mask(rem, b);
+    Some((quot + mask, rem + (b & mask)))
+}
 
-    if rem != 0 && (rem < 0) != (b < 0) {
-        Some((quot - 1, rem + b))
-    } else {
-        Some((quot, rem))
-    }
+/// `floor_divmod` for `i128` operands.
+///
+/// Used by the LongInt division paths: values just outside i64 (e.g. `2**63 % 1000`
+/// or `2**100 // 2**50`) still fit in 128 bits, and one native division there is far
+/// cheaper than a `BigInt` division that allocates its quotient and remainder.
+/// Returns `None` on division by zero or overflow (`i128::MIN / -1`).
+pub(crate) fn floor_divmod_i128(a: i128, b: i128) -> Option<(i128, i128)> {
+    let quot = a.checked_div(b)?;
+    let rem = a % b;
+    // Same sign mask as floor_adjust_mask, at 128 bits
+    let mask = ((rem ^ b) >> 127) & -i128::from(rem != 0);
+    Some((quot + mask, rem + (b & mask)))
+}
+
+/// Computes Python-style modulo, where the result takes the sign of the divisor.
+///
+/// `b` must be non-zero. `i64::MIN % -1` gives 0, as in Python.
+#[inline]
+pub(crate) fn floor_mod(a: i64, b: i64) -> i64 {
+    let rem = a.wrapping_rem(b);
+    rem + (b & floor_adjust_mask(rem, b))
+}
+
+/// Returns -1 when a truncated remainder needs flooring (non-zero and of opposite
+/// sign to the divisor), otherwise 0.
+///
+/// Mixed-sign operands make the equivalent branch unpredictable, so the mask is
+/// built arithmetically: the caller adds it to the quotient and `b & mask` to the
+/// remainder.
+#[inline]
+fn floor_adjust_mask(rem: i64, b: i64) -> i64 {
+    ((rem ^ b) >> 63) & -i64::from(rem != 0)
+}
+
+/// Hashes an `int` that fits in an i64.
+///
+/// Shared by `Value::Int` and in-range `LongInt`s so equal ints always hash equally.
+/// A splitmix64-style finalizer replaces running SipHash over the discriminant and value:
+/// it is a handful of multiply/xor-shift steps, spreads entropy across all 64 bits (the
+/// dict/set tables take their control bytes from the high bits), and is a bijection, so
+/// two distinct i64 keys can never collide on the full hash.
+#[inline]
+pub(crate) fn hash_i64(i: i64) -> u64 {
+    // Seed keeps small ints away from the fixed point at zero
+    let mut x = i.cast_unsigned() ^ 0x9e37_79b9_7f4a_7c15;
+    x = (x ^ (x >> 30)).wrapping_mul(0xbf58_476d_1ce4_e5b9);
+    x = (x ^ (x >> 27)).wrapping_mul(0x94d0_49bb_1331_11eb);
+    x ^ (x >> 31)
 }
 
 /// Converts a heap `HeapId` into its tagged `id()` value, ensuring it never collides with other spaces.
@@ -2318,17 +2380,98 @@ fn longint_to_repeat_count(li: &LongInt) -> RunResult<usize> {
     }
 }
 
+/// Returns the value of an `Int` or `Bool` as `i64`, or `None` for any other value.
+#[inline]
+fn small_int(value: &Value) -> Option<i64> {
+    match value {
+        Value::Int(i) => Some(*i),
+        Value::Bool(b) => Some(i64::from(*b)),
+        _ => None,
+    }
+}
+
+/// Computes `long_int & mask` when `value` is a LongInt and `mask` a non-negative
+/// `Int` or `Bool`, returning `None` for any other operand pair.
+///
+/// A non-negative i64 mask clears every bit above bit 62, so only the LongInt's
+/// lowest 64 bits matter: the result comes from its low digit without building a
+/// `BigInt` for either operand.
+fn long_int_and_mask(value: &Value, mask: &Value, heap: &Heap<impl ResourceTracker>) -> Option<i64> {
+    let mask = small_int(mask).filter(|m| *m >= 0)?;
+    let Value::Ref(id) = value else {
+        return None;
+    };
+    match heap.get(*id) {
+        HeapData::LongInt(li) => Some(li.low_i64_bits() & mask),
+        _ => None,
+    }
+}
+
+/// Returns `base ** exp` for a non-negative exponent when the result is known without
+/// exponentiating: any base to the power 0, or a base of 0, 1 or -1.
+///
+/// Only the exponent's zeroness and parity are needed, so huge exponents (including
+/// `LongInt` ones) cost nothing. Returns `None` for other bases.
+#[inline]
+fn unit_base_pow(base: i64, exp_is_zero: bool, exp_is_odd: bool) -> Option<i64> {
+    match base {
+        _ if exp_is_zero => Some(1),
+        0 => Some(0),
+        1 => Some(1),
+        -1 => Some(if exp_is_odd { -1 } else { 1 }),
+        _ => None,
+    }
+}
+
+/// Computes a bitwise operation on two `i64` operands without going through `BigInt`.
+///
+/// Returns `Ok(None)` when the result does not fit in an `i64` (a left shift that
+/// overflows), in which case the caller falls back to the `BigInt` path.
+/// Negative shift counts raise `ValueError`, matching the `BigInt` path.
+#[inline]
+fn i64_bitwise(l: i64, r: i64, op: BitwiseOp) -> RunResult<Option<i64>> {
+    Ok(match op {
+        BitwiseOp::And => Some(l & r),
+        BitwiseOp::Or => Some(l | r),
+        BitwiseOp::Xor => Some(l ^ r),
+        BitwiseOp::LShift => {
+            if r < 0 {
+                return Err(ExcType::value_error_negative_shift_count());
+            }
+            if l == 0 {
+                // 0 << n is 0 for any count, including ones past the i64 width
+                return Ok(Some(0));
+            }
+            // The shift is lossless iff shifting back recovers the original value
+            let shift = u32::try_from(r).ok().filter(|&shift| shift < i64::BITS);
+            shift.and_then(|shift| {
+                let shifted = l << shift;
+                (shifted >> shift == l).then_some(shifted)
+            })
+        }
+        BitwiseOp::RShift => {
+            if r < 0 {
+                return Err(ExcType::value_error_negative_shift_count());
+            }
+            // Shifting by 64 or more leaves only the sign: 0 or -1
+            let shift = u32::try_from(r).unwrap_or(u32::MAX).min(i64::BITS - 1);
+            Some(l >> shift)
+        }
+    })
+}
+
 /// Extracts a BigInt from a Value for bitwise operations.
 ///
-/// Returns `Some(BigInt)` for Int, Bool, and LongInt values.
+/// Returns `Some(BigInt)` for Int, Bool, and LongInt values, borrowing LongInts
+/// from the heap rather than cloning their digits.
 /// Returns `None` for other types (Float, Str, etc.).
-fn extract_bigint(value: &Value, heap: &Heap<impl ResourceTracker>) -> Option<BigInt> {
+fn extract_bigint<'h>(value: &Value, heap: &'h Heap<impl ResourceTracker>) -> Option<Cow<'h, BigInt>> {
     match value {
-        Value::Int(i) => Some(BigInt::from(*i)),
-        Value::Bool(b) => Some(BigInt::from(i64::from(*b))),
+        Value::Int(i) => Some(Cow::Owned(BigInt::from(*i))),
+        Value::Bool(b) => Some(Cow::Owned(BigInt::from(i64::from(*b)))),
         Value::Ref(id) => {
             if let HeapData::LongInt(li) = heap.get(*id) {
-                Some(li.inner().clone())
+                Some(Cow::Borrowed(li.inner()))
             } else {
                 None
             }
@@ -2388,12 +2531,14 @@ fn bigint_pow(base: BigInt, exp: u64) -> BigInt {
         return base;
     }
 
-    // Use repeated squaring
+    // Use repeated squaring. The loop stops at the top bit so the base is never
+    // squared once more after its last use: that final square would be the largest
+    // multiplication of the whole computation.
     let mut result = BigInt::from(1);
     let mut b = base;
     let mut e = exp;
 
-    while e > 0 {
+    while e > 1 {
         if e & 1 == 1 {
             result *= &b;
         }
@@ -2401,7 +2546,185 @@ fn bigint_pow(base: BigInt, exp: u64) -> BigInt {
         e >>= 1;
     }
 
-    result
+    result * b
+}
+
+/// Returns the items of a list or tuple, tagged with whether it is a tuple.
+///
+/// Only these two types are walked by `sequence_eq`; everything else (including
+/// namedtuples, which compare equal to plain tuples) goes through `HeapData::py_eq`.
+fn eq_sequence_items(data: &HeapData) -> Option<(bool, &[Value])> {
+    match data {
+        HeapData::List(list) => Some((false, list.as_slice())),
+        HeapData::Tuple(tuple) => Some((true, tuple.as_slice())),
+        _ => None,
+    }
+}
+
+/// The two sequences compared by one `sequence_eq` stack frame.
+#[derive(Clone, Copy)]
+enum SeqEqPair<'a> {
+    /// Item slices borrowed from a `List`/`Tuple` whose `py_eq` was called directly.
+    Items(&'a [Value], &'a [Value]),
+    /// A pair of lists or tuples still in the heap, re-read on every step.
+    Heap(HeapId, HeapId),
+}
+
+impl SeqEqPair<'_> {
+    /// Returns the item slices of both sequences.
+    fn items<'s>(&'s self, heap: &'s Heap<impl ResourceTracker>) -> (&'s [Value], &'s [Value]) {
+        match self {
+            Self::Items(left, right) => (*left, *right),
+            Self::Heap(left, right) => {
+                let (Some((_, left_items)), Some((_, right_items))) =
+                    (eq_sequence_items(heap.get(*left)), eq_sequence_items(heap.get(*right)))
+                else {
+                    unreachable!("sequence_eq only stacks lists and tuples");
+                };
+                (left_items, right_items)
+            }
+        }
+    }
+}
+
+/// One stack frame of `sequence_eq`.
+struct SeqEqFrame<'a> {
+    /// The sequences being compared.
+    pair: SeqEqPair<'a>,
+    /// Index of the next item to compare.
+    index: usize,
+    /// Recursion depth held for this nesting level, released when the frame is dropped.
+    token: RecursionToken,
+}
+
+impl DropWithHeap for SeqEqFrame<'_> {
+    #[inline]
+    fn drop_with_heap<T: ResourceTracker>(self, heap: &mut Heap<T>) {
+        self.token.drop_with_heap(heap);
+    }
+}
+
+/// One step of the `sequence_eq` walk, decided while the heap is borrowed immutably.
+enum SeqEqStep {
+    /// All items of the top pair were equal.
+    Finished,
+    /// The current items are the same object.
+    Advance,
+    /// The current items are same-kind, same-length sequences to walk next.
+    Descend(HeapId, HeapId),
+    /// The current items (new references) need a regular `py_eq`.
+    Compare(Value, Value),
+}
+
+/// Compares two heap values with `sequence_eq` if both are lists or both are tuples.
+///
+/// Lists and tuples are compared while they stay in the heap (rather than being taken
+/// out by `Heap::with_two`), so nested items referring back to them can still be read.
+///
+/// Returns `Ok(None)` if the two values are not both lists or both tuples.
+fn heap_sequence_eq(
+    id1: HeapId,
+    id2: HeapId,
+    heap: &mut Heap<impl ResourceTracker>,
+    interns: &Interns,
+) -> Result<Option<bool>, ResourceError> {
+    match (eq_sequence_items(heap.get(id1)), eq_sequence_items(heap.get(id2))) {
+        (Some((is_tuple1, _)), Some((is_tuple2, _))) if is_tuple1 == is_tuple2 => {
+            sequence_eq(SeqEqPair::Heap(id1, id2), heap, interns).map(Some)
+        }
+        _ => Ok(None),
+    }
+}
+
+/// Compares the items of two lists or two tuples; the implementation of
+/// `List::py_eq` and `Tuple::py_eq`.
+pub(crate) fn sequence_items_eq(
+    left: &[Value],
+    right: &[Value],
+    heap: &mut Heap<impl ResourceTracker>,
+    interns: &Interns,
+) -> Result<bool, ResourceError> {
+    sequence_eq(SeqEqPair::Items(left, right), heap, interns)
+}
+
+/// Compares two lists or two tuples element-wise with an explicit stack.
+///
+/// Nested lists/tuples are walked iteratively instead of recursing through `py_eq`
+/// once per nesting level, so deep structures cost stack entries rather than Rust
+/// frames. Each level still holds a `RecursionToken` (so self-referential structures
+/// raise `RecursionError`, as in CPython). The tokens live in the stack frames: they
+/// are released as frames are popped, or by the stack's guard on early returns and errors.
+fn sequence_eq(
+    pair: SeqEqPair<'_>,
+    heap: &mut Heap<impl ResourceTracker>,
+    interns: &Interns,
+) -> Result<bool, ResourceError> {
+    let (left, right) = pair.items(heap);
+    if left.len() != right.len() {
+        return Ok(false);
+    }
+    let token = heap.incr_recursion_depth()?;
+    let mut stack: SmallVec<[SeqEqFrame<'_>; 8]> = SmallVec::new();
+    stack.push(SeqEqFrame { pair, index: 0, token });
+    defer_drop_mut!(stack, heap);
+    while let Some(&SeqEqFrame { pair, index, .. }) = stack.last() {
+        heap.check_time()?;
+        let step = {
+            let (left_items, right_items) = pair.items(heap);
+            match (left_items.get(index), right_items.get(index)) {
+                (Some(Value::Ref(a)), Some(Value::Ref(b))) if a == b => SeqEqStep::Advance,
+                (Some(left_item @ Value::Ref(a)), Some(right_item @ Value::Ref(b))) => {
+                    match (eq_sequence_items(heap.get(*a)), eq_sequence_items(heap.get(*b))) {
+                        (Some((is_tuple_a, items_a)), Some((is_tuple_b, items_b))) => {
+                            // A list never equals a tuple
+                            if is_tuple_a != is_tuple_b || items_a.len() != items_b.len() {
+                                return Ok(false);
+                            }
+                            SeqEqStep::Descend(*a, *b)
+                        }
+                        _ => SeqEqStep::Compare(left_item.clone_with_heap(heap), right_item.clone_with_heap(heap)),
+                    }
+                }
+                (Some(left_item), Some(right_item)) => {
+                    SeqEqStep::Compare(left_item.clone_with_heap(heap), right_item.clone_with_heap(heap))
+                }
+                _ => SeqEqStep::Finished,
+            }
+        };
+        match step {
+            SeqEqStep::Finished => {
+                if let Some(frame) = stack.pop() {
+                    frame.drop_with_heap(heap);
+                }
+            }
+            SeqEqStep::Advance => advance_top(stack),
+            SeqEqStep::Descend(a, b) => {
+                advance_top(stack);
+                let token = heap.incr_recursion_depth()?;
+                stack.push(SeqEqFrame {
+                    pair: SeqEqPair::Heap(a, b),
+                    index: 0,
+                    token,
+                });
+            }
+            SeqEqStep::Compare(left_item, right_item) => {
+                advance_top(stack);
+                let items = (left_item, right_item);
+                defer_drop!(items, heap);
+                if !items.0.py_eq(&items.1, heap, interns)? {
+                    return Ok(false);
+                }
+            }
+        }
+    }
+    Ok(true)
+}
+
+/// Moves the top frame of the `sequence_eq` stack on to its next item.
+fn advance_top(stack: &mut [SeqEqFrame<'_>]) {
+    if let Some(frame) = stack.last_mut() {
+        frame.index += 1;
+    }
 }
 
 #[cfg(test)]
@@ -2531,4 +2854,76 @@ mod tests {
         assert!(result.is_err());
         value.drop_with_heap(&mut heap);
     }
+
+    /// Tests that `bigint_pow` matches `BigInt::pow` for small and odd/even exponents.
+    #[test]
+    fn bigint_pow_matches_pow() {
+        for base in [-3i64, 2, 7] {
+            for exp in 0u32..=17 {
+                assert_eq!(
+                    bigint_pow(BigInt::from(base), u64::from(exp)),
+                    BigInt::from(base).pow(exp),
+                    "{base} ** {exp}"
+                );
+            }
+        }
+    }
+
+    /// Tests that the branchless `floor_divmod` and `floor_mod` agree with `BigInt` flooring.
+    #[test]
+    fn floor_divmod_matches_bigint() {
+        let values = [
+            i64::MIN,
+            i64::MIN + 1,
+            -7,
+            -5,
+            -3,
+            -2,
+            -1,
+            0,
+            1,
+            2,
+            3,
+            4,
+            5,
+            7,
+            i64::MAX,
+        ];
+        for a in values {
+            for b in values {
+                if b == 0 {
+                    continue;
+                }
+                let (quot, rem) = BigInt::from(a).div_mod_floor(&BigInt::from(b));
+                let expected = quot.to_i64().map(|q| (q, rem.to_i64().unwrap()));
+                assert_eq!(floor_divmod(a, b), expected, "divmod({a}, {b})");
+                assert_eq!(BigInt::from(floor_mod(a, b)), rem, "{a} % {b}");
+            }
+        }
+    }
+
+    /// Tests that `floor_divmod_i128` floors like `BigInt` across the i128 range.
+    #[test]
+    fn floor_divmod_i128_matches_bigint() {
+        let values = [
+            i128::MIN,
+            -(1 << 100),
+            -7,
+            -1,
+            1,
+            3,
+            1000,
+            1 << 63,
+            (1 << 100) + 1,
+            i128::MAX,
+        ];
+        for a in values {
+            for b in values {
+                let (quot, rem) = BigInt::from(a).div_mod_floor(&BigInt::from(b));
+                let expected = quot.to_i128().map(|q| (q, rem.to_i128().unwrap()));
+                assert_eq!(floor_divmod_i128(a, b), expected, "divmod({a}, {b})");
+            }
+        }
+        assert_eq!(floor_divmod_i128(5, 0), None);
+    }
 }
@@ -83,3 +83,12 @@ assert result == [], f'gather with empty *args: {result}'
 coro_tuple = (a(), b())
 result = await asyncio.gather(*coro_tuple)  # pyright: ignore
 assert result == ['a', 'b'], f'gather with *tuple unpacking: {result}'
+
+
+# === Many coroutines ===
+async def ident(x):
+    return x
+
+
+result = await asyncio.gather(*[ident(i) for i in range(200)])  # pyright: ignore
+assert result == list(range(200)), 'gather of many coroutines should preserve order'
@@ -35,3 +35,13 @@ async def fetch_all(keys):
 
 outer = await asyncio.gather(fetch_all([1, 2]), fetch_all([3, 4]))  # pyright: ignore
 assert outer == [[1, 2], [3, 4]], f'nested gather with generator unpacking: {outer}'
+
+
+# === Gather mixing external futures with multiple coroutine tasks ===
+async def double_ext(n):
+    val = await async_call(n)
+    return val * 2
+
+
+mixed = await asyncio.gather(async_call(1), double_ext(2), double_ext(3), async_call(4))  # pyright: ignore
+assert mixed == [1, 4, 6, 4], f'gather mixing external futures and tasks: {mixed}'
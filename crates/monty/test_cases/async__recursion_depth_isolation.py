@@ -25,3 +25,16 @@ results = await asyncio.gather(  # pyright: ignore
     recurse_then_call(40),
 )
 assert results == ['done', 'done'], f'both tasks should complete: {results}'
+
+
+# === Nested gather ===
+# A task that is itself partway down a recursion gathers children; the children
+# get their own budget rather than inheriting the parent's suspended depth.
+async def recurse_then_gather(n):
+    if n == 0:
+        return await asyncio.gather(recurse_then_call(40), recurse_then_call(40))
+    return await recurse_then_gather(n - 1)
+
+
+results = await asyncio.gather(recurse_then_gather(5), recurse_then_call(40))  # pyright: ignore
+assert results == [['done', 'done'], 'done'], f'nested gathered tasks should complete: {results}'
@@ -60,25 +60,46 @@ except ValueError as e:
     assert args == ('test error',), 'exception args should be accessible via getattr'
 
 # === Dynamic (heap-allocated) attribute name strings ===
-# These test that getattr works with non-interned strings (e.g. from concatenation)
+# These test that getattr works with non-interned strings built at runtime
+# (literal-only concatenation like 'sta' + 'rt' is folded at parse time)
 s2 = slice(5, 15, 3)
-attr_name = 'sta' + 'rt'
+prefix = 'sta'
+attr_name = prefix + 'rt'
 assert getattr(s2, attr_name) == 5, 'getattr with concatenated string should work'
 
-attr_name = 'st' + 'op'
+attr_name = ''.join(['st', 'op'])
 assert getattr(s2, attr_name) == 15, 'getattr with concatenated "stop" should work'
 
-attr_name = 'st' + 'ep'
+suffix = 'ep'
+attr_name = 'st' + suffix
 assert getattr(s2, attr_name) == 3, 'getattr with concatenated "step" should work'
 
 # Dynamic attribute name with default for missing attribute
-attr_name = 'non' + 'existent'
+attr_name = ''.join(['non', 'existent'])
 assert getattr(s2, attr_name, 42) == 42, 'getattr with dynamic missing attr should return default'
 
 # Dynamic attribute name on exception
 try:
     raise TypeError('dynamic test')
 except TypeError as e:
-    attr_name = 'ar' + 'gs'
+    attr_name = ''.join(['ar', 'gs'])
     args = getattr(e, attr_name)
     assert args == ('dynamic test',), 'exception args via dynamic string should work'
+
+# Literal names inside a function (compiled to a dedicated opcode)
+
+
+def get_bounds(obj):
+    return getattr(obj, 'start'), getattr(obj, 'stop', None), getattr(obj, 'missing', 'fallback')
+
+
+assert get_bounds(slice(2, 8)) == (2, 8, 'fallback'), 'getattr with literal names in a function'
+
+# A shadowed getattr is called normally, not treated as the builtin
+
+
+def shadowed(getattr):
+    return getattr(s, 'start')
+
+
+assert shadowed(lambda obj, name: name) == 'start', 'shadowed getattr should call the local function'
@@ -43,6 +43,26 @@ assert d == {'b': 2}, 'pop removes key'
 d = {'a': 1}
 assert d.pop('missing', 'default') == 'default', 'pop missing with default'
 
+# === Dict with many int keys ===
+d = {}
+for i in range(-50, 50):
+    d[i * 7] = i
+assert len(d) == 100, 'int keys are distinct'
+assert d[-350] == -50, 'negative int key'
+assert d[343] == 49, 'positive int key'
+assert 5 not in d, 'missing int key'
+assert d.pop(0) == 0, 'pop int key'
+assert 0 not in d, 'popped int key is gone'
+d[2**63 - 1] = 'max'
+assert d[2**63 - 1] == 'max', 'i64 max key'
+d[2**63] = 'past max'
+d[-(2**100)] = 'neg big'
+assert d[2**62 * 2] == 'past max', 'computed bigint key'
+assert d[-(2**100)] == 'neg big', 'negative bigint key'
+assert 2**64 not in d, 'missing bigint key'
+assert d.pop(2**63) == 'past max', 'pop bigint key'
+assert d[2**63 - 1] == 'max', 'i64 key survives bigint pop'
+
 # === Dict with tuple key ===
 d = {(1, 2): 'value'}
 assert d[(1, 2)] == 'value', 'tuple key'
@@ -38,6 +38,7 @@ assert hash(range(1, 10, 2)) != hash(range(1, 10, 3)), 'different steps hash dif
 
 # === Different values should hash differently ===
 assert hash(1) != hash(2), 'different ints hash differently'
+assert len({hash(i) for i in range(1000)}) == 1000, 'small ints have distinct hashes'
 assert hash('a') != hash('b'), 'different strs hash differently'
 assert hash(b'a') != hash(b'b'), 'different bytes hash differently'
 assert hash((1, 2)) != hash((1, 3)), 'different tuples hash differently'
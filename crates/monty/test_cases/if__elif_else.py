@@ -205,3 +205,35 @@ elif temp > 0:
 else:
     p = 4
 assert p == 2, 'second condition matches temp=10'
+
+# === Comparisons used directly as branch conditions ===
+items = [1, 2, 3]
+none_value = None
+q = []
+if 2 in items:
+    q.append('in')
+if 5 not in items:
+    q.append('not in')
+if none_value is None:
+    q.append('is')
+if items is not None:
+    q.append('is not')
+if 10 % 3 == 1:
+    q.append('mod eq')
+if 'a' < 'b' <= 'b':
+    q.append('chain')
+assert q == ['in', 'not in', 'is', 'is not', 'mod eq', 'chain'], 'comparisons as conditions'
+
+count = 0
+while count < 5:
+    count += 1
+assert count == 5, 'comparison as while condition'
+
+try:
+    if 1 in 5:
+        r = 'taken'
+    else:
+        r = 'not taken'
+except TypeError:
+    r = 'raised'
+assert r == 'raised', 'failing comparison in condition raises'
@@ -94,6 +94,11 @@ assert h1 == h2, 'same bigint literal has same hash'
 # Computed equal value should have same hash
 h3 = hash(10**40)
 assert h1 == h3, 'bigint literal hash equals computed hash'
+assert hash(-10000000000000000000000000000000000000000) == hash(-(10**40)), 'negative literal hash'
+assert hash(10**40) != hash(-(10**40)), 'sign is part of the bigint hash'
+lit_keys = {10000000000000000000000000000000000000000: 'lit'}
+assert lit_keys[10**40] == 'lit', 'computed bigint finds literal key'
+assert lit_keys[10000000000000000000000000000000000000000] == 'lit', 'literal finds literal key'
 
 # === BigInt literal bitwise operations ===
 assert 10000000000000000000000000000000000000000 & 0xFF == (10**40) & 0xFF, 'bigint literal & int'
@@ -166,6 +171,11 @@ pow_2_64 = 2**64
 assert pow_2_64 == pow_2_63 * 2, 'pow overflow'
 pow_2_100 = 2**100
 assert pow_2_100 > pow_2_64, 'large pow is greater'
+assert pow_2_100 == pow_2_64 * 2**36, 'pow just past i64 is exact'
+assert (-3) ** 41 == -36472996377170786403, 'negative odd pow past i64'
+assert 10**20 == 100000000000000000000, 'pow of ten past i64'
+assert 2**127 == (2**63) * (2**64), 'pow at the i128 boundary'
+assert 3**100 == 515377520732011331036461129765621272702107522001, 'pow past i128'
 
 # === Negative overflow ===
 neg_bigger = -MAX_I64 - 2
@@ -309,6 +319,16 @@ assert dm_rem == expected_rem, 'divmod remainder with bigint'
 dm2 = divmod(pow_2_100, pow_2_50)
 assert dm2[0] == pow_2_50, 'divmod bigint by bigint quotient'
 assert dm2[1] == 0, 'divmod bigint by bigint remainder'
+assert pow_2_100 % (pow_2_50 + 1) == 1, 'bigint % bigint within i128'
+assert pow_2_100 // (pow_2_50 + 1) == pow_2_50 - 1, 'bigint // bigint within i128'
+assert (MIN_I64 - 5) % 1000 == 187, 'negative bigint % int floors'
+assert (MIN_I64 - 5) // 1000 == -9223372036854776, 'negative bigint // int floors'
+assert 7 % -(2**64) == 7 - 2**64, 'int % negative bigint floors'
+assert 7 // -(2**64) == -1, 'int // negative bigint floors'
+assert divmod(-(2**64), 3) == (-6148914691236517206, 2), 'divmod bigint by int within i128'
+assert MIN_I64 // -1 == 2**63, 'i64::MIN // -1 promotes'
+assert divmod(-(2**100) - 1, 2**64) == (-(2**36) - 1, 2**64 - 1), 'divmod negative bigint floors'
+assert divmod(2**100 + 7, -(2**64)) == (-(2**36) - 1, 7 - 2**64), 'divmod by negative bigint floors'
 
 hex_result = hex(bigger)
 assert hex_result == '0x8000000000000000', 'hex of bigint'
@@ -331,6 +351,10 @@ str_result = str(bigger)
 expected_repr = str(MAX_I64 + 1)
 assert repr_result == expected_repr, 'repr of bigint'
 assert str_result == expected_repr, 'str of bigint'
+assert str_result == '9223372036854775808', 'str of bigint digits'
+assert str(-(2**64)) == '-18446744073709551616', 'str of negative bigint'
+assert str(10**40) == '1' + '0' * 40, 'str of multi-limb bigint'
+assert f'{2**70}' == '1180591620717411303424', 'f-string of bigint'
 
 # === Bool conversion ===
 assert bool(bigger), 'bigint is truthy'
@@ -339,6 +363,13 @@ assert bool(-bigger), 'negative bigint is truthy'
 # === Demote back to i64 ===
 demote_result = bigger - bigger
 assert demote_result == 0, 'bigint - bigint can demote to i64'
+huge = 3**100
+huge_copy = 3**100
+assert huge - huge == 0, 'multi-limb bigint minus itself'
+assert huge - huge_copy == 0, 'multi-limb bigint minus equal bigint'
+assert -huge - -huge_copy == 0, 'negative multi-limb bigint minus equal bigint'
+assert huge ^ huge_copy == 0, 'multi-limb bigint xor equal bigint'
+assert huge - (huge_copy + 1) == -1, 'multi-limb bigint minus nearly equal bigint'
 demote_result2 = bigger - 1
 assert demote_result2 == MAX_I64, 'bigint - 1 demotes to i64::MAX'
 
@@ -356,6 +387,16 @@ assert 5 % -3 == -1, '5 % -3 should be -1'
 assert -5 % 3 == 1, '-5 % 3 should be 1'
 assert -5 % -3 == -2, '-5 % -3 should be -2'
 assert 7 % -4 == -1, '7 % -4 should be -1'
+assert -7 // 2 == -4, '-7 // 2 should be -4'
+assert 7 // -2 == -4, '7 // -2 should be -4'
+assert -6 // 3 == -2, 'exact negative floor division'
+assert -6 % 3 == 0, 'exact negative modulo is zero'
+assert MIN_I64 % -1 == 0, 'i64::MIN % -1 should be 0'
+assert MIN_I64 // -1 == MAX_I64 + 1, 'i64::MIN // -1 should promote'
+assert divmod(-7, 2) == (-4, 1), 'divmod floors toward negative infinity'
+assert divmod(MIN_I64, -1) == (MAX_I64 + 1, 0), 'divmod(i64::MIN, -1) should promote'
+x = -7
+assert x % 3 == 2, 'mod compared against a constant'
 
 # === Bug 3: += overflow ===
 x = MAX_I64
@@ -393,9 +434,31 @@ assert big & 0xFF == 0, '2**100 & 0xFF'
 assert big | 1 == big + 1, '2**100 | 1'
 assert big ^ big == 0, 'bigint ^ same bigint'
 assert big >> 50 == 2**50, '2**100 >> 50'
+assert (-big) & (big + 5) == big, 'negative bigint & bigint'
+assert (-big) | 3 == -big + 3, 'negative bigint | int'
+assert (big + 1) ^ (big * 2) == big * 3 + 1, 'bigint ^ bigint'
+assert (-big) >> 99 == -2, 'negative bigint >> int'
+assert (big + 2**63 + 5) & (2**63 - 1) == 5, 'multi-limb bigint & i64 max mask'
+assert 0xFF & (big + 0x1234) == 0x34, 'small mask & bigint'
+assert (-big - 1) & 0xFF == 0xFF, 'negative bigint & small mask'
+assert (-big + 1) & 0xFFFF == 1, 'negative bigint & mask keeps low bits'
+assert (-(2**64) - 3) & (2**63 - 1) == 2**63 - 3, 'negative bigint & i64 max mask'
+assert (big + 3) & True == 1, 'bigint & True'
+assert big & -1 == big, 'bigint & negative int uses full path'
 assert 1 << 100 == big, '1 << 100'
 assert (big + 0xFF) & 0xFF == 0xFF, 'bigint with low bits & mask'
 
+# === Shifts at the i64 boundary ===
+assert 1 << 62 == 4611686018427387904, '1 << 62 fits in i64'
+assert 1 << 63 == 9223372036854775808, '1 << 63 overflows to bigint'
+assert -1 << 63 == -9223372036854775808, '-1 << 63 is i64 min'
+assert -1 << 64 == -18446744073709551616, '-1 << 64 overflows to bigint'
+assert 3 << 62 == 13835058055282163712, '3 << 62 loses no bits'
+assert 5 >> 100 == 0, 'positive >> huge = 0'
+assert -5 >> 100 == -1, 'negative >> huge = -1'
+assert -5 >> 1 == -3, 'negative >> rounds toward -inf'
+assert True << 3 == 8, 'bool << int'
+
 # === Large result operations (should succeed with NoLimitTracker) ===
 # These are large but allowed since test runner uses NoLimitTracker
 x = 2**100000  # ~12.5KB - well under any reasonable limit
@@ -410,6 +473,14 @@ assert 1**10000000 == 1, '1 ** huge = 1'
 assert (-1) ** 10000000 == 1, '(-1) ** huge_even = 1'
 assert (-1) ** 10000001 == -1, '(-1) ** huge_odd = -1'
 assert 0 << 10000000 == 0, '0 << huge = 0'
+assert 1 ** (2**40) == 1, '1 ** exponent past u32 = 1'
+assert (-1) ** (2**40 + 1) == -1, '(-1) ** odd exponent past u32 = -1'
+assert (-1) ** (2**100 + 1) == -1, '(-1) ** odd bigint exponent = -1'
+assert 0 ** (2**100) == 0, '0 ** bigint exponent = 0'
+assert True ** (2**40) == 1, 'True ** exponent past u32 = 1'
+assert type(True ** (2**40)) is int, 'True ** large exponent stays int'
+assert False ** (2**40) == 0, 'False ** exponent past u32 = 0'
+assert 0 << (2**100) == 0, '0 << bigint shift count = 0'
 
 # === LongInt in range() ===
 # Note: Monty raises OverflowError immediately for range(10**100), while CPython
@@ -465,3 +536,25 @@ assert b'ab' * neg == b'', 'bytes * negative LongInt'
 zero = big - big
 assert 'ab' * zero == '', 'string * zero LongInt'
 assert b'ab' * zero == b'', 'bytes * zero LongInt'
+
+# === Add/sub near the i128 boundary ===
+i128_max = 2**127 - 1
+assert i128_max + 1 == 2**127, 'i128 max + 1 overflows i128'
+assert -i128_max - 2 == -(2**127) - 1, 'i128 min - 1 overflows i128'
+assert i128_max + i128_max == 2**128 - 2, 'i128 max + i128 max'
+assert i128_max - (-i128_max) == 2**128 - 2, 'i128 max - i128 min'
+assert (MAX_I64 + 1) - (MAX_I64 + 1) == 0, 'bigint - bigint demotes to zero'
+assert (MAX_I64 + 5) - 4 == MAX_I64 + 1, 'bigint - int stays bigint'
+assert 5 - (MAX_I64 + 5) == -MAX_I64, 'int - bigint demotes'
+assert MIN_I64 * MIN_I64 == 2**126, 'i64 min squared'
+
+# === Int vs LongInt comparisons ===
+assert MAX_I64 < MAX_I64 + 1, 'i64 max < bigint'
+assert MAX_I64 + 1 > MAX_I64, 'bigint > i64 max'
+assert MIN_I64 > MIN_I64 - 1, 'i64 min > negative bigint'
+assert MIN_I64 - 1 < MIN_I64, 'negative bigint < i64 min'
+assert MIN_I64 - 1 < 0 < MAX_I64 + 1, 'chained bigint comparison'
+assert 0 != MAX_I64 + 1, 'int != bigint'
+assert not (MIN_I64 - 1 == MIN_I64), 'negative bigint != i64 min'
+assert max(3, 2**64, -(2**64)) == 2**64, 'max over mixed ints'
+assert min(3, 2**64, -(2**64)) == -(2**64), 'min over mixed ints'
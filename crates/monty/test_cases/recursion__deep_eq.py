@@ -21,3 +21,26 @@ for _ in range(29):
 
 result2 = a == c
 assert result2 == False, 'structurally different nested lists should not be equal'
+
+# Nested tuples and mixed list/tuple nesting
+t1 = ()
+t2 = ()
+for _ in range(30):
+    t1 = (1, [t1], 'x')
+    t2 = (1, [t2], 'x')
+assert t1 == t2, 'structurally equal nested tuples should be equal'
+assert [t1] != [(t2,)], 'list vs tuple at the same position is not equal'
+assert [1, [2, [3]]] != [1, [2, (3,)]], 'innermost list vs tuple is not equal'
+assert [1, [2, [3]]] != [1, [2, [3, 4]]], 'innermost length mismatch is not equal'
+
+# Self-referential lists
+r1 = []
+r1.append(r1)
+r2 = []
+r2.append(r2)
+assert r1 == r1, 'identical self-referential list equals itself'
+try:
+    r1 == r2
+    assert False, 'comparing distinct self-referential lists should raise RecursionError'
+except RecursionError:
+    pass
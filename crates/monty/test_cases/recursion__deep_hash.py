@@ -44,3 +44,24 @@ try:
     s.add(w)
 except RecursionError:
     pass  # acceptable if depth guard triggers
+
+# === Deep hashes beyond the recursion limit succeed and are consistent ===
+a = (1,)
+b = (1,)
+for _ in range(2000):
+    a = (a,)
+    b = (b,)
+assert hash(a) == hash(b), 'equal deep tuples hash equally'
+
+fa = frozenset({1})
+fb = frozenset({1})
+for _ in range(2000):
+    fa = frozenset({fa})
+    fb = frozenset({fb})
+assert hash(fa) == hash(fb), 'equal deep frozensets hash equally'
+
+# tuples sharing sub-tuples (a DAG) hash without revisiting shared parts
+shared = (1, 2)
+for _ in range(16):
+    shared = (shared, shared)
+assert isinstance(hash(shared), int), 'hash of tuple DAG'
@@ -132,3 +132,13 @@ assert s[i] == 'b', 'getitem with variable index'
 s = 'abc'
 assert s[False] == 'a', 'str getitem with False'
 assert s[True] == 'b', 'str getitem with True'
+
+# === Literal concatenation ===
+assert 'te' + 'st' == 'test', 'literal concat'
+assert hash('te' + 'st') == hash('test'), 'literal concat hash'
+assert 'a' + 'b' + 'c' == 'abc', 'chained literal concat'
+assert 'ab' + '' == 'ab', 'literal concat with empty'
+assert getattr(slice(1, 2), 'sta' + 'rt') == 1, 'literal concat getattr name'
+prefix = 'te'
+assert prefix + 'st' == 'test', 'runtime concat'
+assert hash(prefix + 'st') == hash('te' + 'st'), 'runtime concat hash matches folded literal'
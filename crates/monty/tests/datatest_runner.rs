@@ -116,25 +116,27 @@ fn parse_fixture(content: &str) -> (String, Expectation, TestConfig) {
 
     assert!(!lines.is_empty(), "Empty fixture file");
 
-    // comment lines with leading # and spaces stripped
-    let comment_lines = lines
-        .iter()
-        .filter(|line| line.starts_with('#'))
-        .map(|line| line.trim_start_matches('#').trim())
-        .collect::<Vec<_>>();
-
-    let mut config = TestConfig {
-        iter_mode: comment_lines.iter().any(|line| line.starts_with("call-external")),
-        async_mode: comment_lines.iter().any(|line| line.starts_with("run-async")),
-        ..Default::default()
-    };
-    // Check for "xfail=" directive
-    if let Some(&xfail_line) = comment_lines.iter().find(|line| line.starts_with("xfail=")) {
-        // Parse until whitespace or end of line
-        let xfail_end = xfail_line.find(|c: char| c.is_whitespace()).unwrap_or(xfail_line.len());
-        let xfail_str = &xfail_line[..xfail_end];
-        config.xfail_monty = xfail_str.contains("monty");
-        config.xfail_cpython = xfail_str.contains("cpython");
+    // Scan comment lines once, picking up every directive in the same pass
+    let mut config = TestConfig::default();
+    let mut seen_xfail = false;
+    for line in &lines {
+        if !line.starts_with('#') {
+            continue;
+        }
+        // comment line with leading # and spaces stripped
+        let directive = line.trim_start_matches('#').trim();
+        if directive.starts_with("call-external") {
+            config.iter_mode = true;
+        } else if directive.starts_with("run-async") {
+            config.async_mode = true;
+        } else if !seen_xfail && directive.starts_with("xfail=") {
+            // Only the first "xfail=" directive counts; parse until whitespace or end of line
+            seen_xfail = true;
+            let xfail_end = directive.find(|c: char| c.is_whitespace()).unwrap_or(directive.len());
+            let xfail_str = &directive[..xfail_end];
+            config.xfail_monty = xfail_str.contains("monty");
+            config.xfail_cpython = xfail_str.contains("cpython");
+        }
     }
 
     // Check for TRACEBACK expectation (triple-quoted string at end of file)
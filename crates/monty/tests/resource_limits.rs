@@ -237,6 +237,37 @@ result
     );
 }
 
+/// Test that memory held by containers grown in place is reconciled after GC.
+///
+/// `list.append` of small ints never allocates a heap entry, so the list's growth is
+/// invisible to the allocation-time estimate. Once GC runs, the tracker's total is
+/// reconciled against the live heap and the next allocation hits the memory limit.
+#[test]
+fn memory_limit_reconciled_after_gc() {
+    let code = r"
+big = []
+for i in range(200000):
+    big.append(i)
+
+# Create a cycle so GC is scheduled, then make enough short-lived allocations to trigger it
+cycle = []
+cycle.append(cycle)
+for i in range(150000):
+    x = [i]
+";
+    let ex = MontyRun::new(code.to_owned(), "test.py", vec![], vec![]).unwrap();
+
+    let limits = ResourceLimits::new().max_memory(1_000_000);
+    let result = ex.run(vec![], LimitedTracker::new(limits), &mut PrintWriter::Stdout);
+
+    let exc = result.expect_err("grown list should count towards the memory limit after GC");
+    assert_eq!(exc.exc_type(), ExcType::MemoryError);
+    assert!(
+        exc.message().is_some_and(|m| m.contains("memory limit exceeded")),
+        "expected memory limit error, got: {exc}"
+    );
+}
+
 #[test]
 fn combined_limits() {
     // Test multiple limits together
@@ -777,6 +808,23 @@ fn bigint_builtin_pow_memory_limit() {
     assert_eq!(exc.exc_type(), ExcType::MemoryError);
 }
 
+/// Test that pow() with a LongInt base is rejected by the size pre-check.
+#[test]
+fn bigint_builtin_pow_longint_base_memory_limit() {
+    let code = "pow(2 ** 100, 1000000)";
+    let ex = MontyRun::new(code.to_owned(), "test.py", vec![], vec![]).unwrap();
+
+    let limits = ResourceLimits::new().max_memory(1_000_000);
+    let result = ex.run(vec![], LimitedTracker::new(limits), &mut PrintWriter::Stdout);
+
+    assert!(
+        result.is_err(),
+        "builtin pow with LongInt base should respect memory limit"
+    );
+    let exc = result.unwrap_err();
+    assert_eq!(exc.exc_type(), ExcType::MemoryError);
+}
+
 /// Test that large BigInt operations are rejected BEFORE allocation via check_large_result.
 ///
 /// The pre-allocation size check estimates result size and rejects operations that would